@@ -0,0 +1,23 @@
+"""
+Helpers shared by the benchmarks.
+"""
+import time
+
+
+def timeit(func, repeat=5, number=1):
+    """
+    Return the best time (in seconds) of given function over several runs.
+
+    :param func: a function without parameters.
+    :param repeat: number of runs.
+    :param number: number of calls per run, the time of a single call being returned.
+    :return: the best time of a call, in seconds.
+    """
+    best = float('inf')
+    loop = range(number)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in loop:
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
@@ -0,0 +1,32 @@
+"""
+Benchmark the restriction of a large interval (one atomic interval per hour of a year,
+on average) to a one-hour window, with &, with clip and with replace.
+
+Usage: python -m benchmarks.bench_clip [n]
+"""
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def main(n=365 * 24, queries=100):
+    rnd = random.Random(42)
+    lowers = sorted(rnd.uniform(0, n) for _ in range(n))
+    year = P.Interval.from_arrays(lowers, [lower + 0.25 for lower in lowers])
+    windows = [P.closedopen(x, x + 1) for x in (rnd.uniform(0, n - 1) for _ in range(queries))]
+    assert all(year.clip(w) == year & w for w in windows)
+
+    print('n={} atomic intervals, {} windows'.format(len(year), queries))
+    for name, func in [
+        ('&', lambda: [year & w for w in windows]),
+        ('clip', lambda: [year.clip(w) for w in windows]),
+        ('replace', lambda: [year.replace(P.CLOSED, w.lower, w.upper, P.OPEN) for w in windows]),
+    ]:
+        print('  {:<8} {:8.3f} ms/window'.format(name, timeit(func) / queries * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,49 @@
+"""
+Benchmark the memory used by an interval with n atomic intervals (measured with
+tracemalloc), either with its atomic intervals stored as named tuples, or stored
+compactly with Interval.compact. The time of a few operations is reported as well.
+
+Usage: python -m benchmarks.bench_compact [n]
+"""
+import random
+import sys
+import tracemalloc
+
+import portion as P
+
+from ._util import timeit
+
+
+def measure(func):
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(n=100000):
+    rnd = random.Random(42)
+    lowers = sorted(rnd.uniform(0, 10 * n) for _ in range(n))
+    uppers = [lower + rnd.uniform(0, 1) for lower in lowers]
+    lefts = [rnd.choice([P.OPEN, P.CLOSED]) for _ in range(n)]
+
+    # Bounds are copied, so that the lists above are not accounted for
+    interval, size = measure(lambda: P.Interval.from_arrays([x + 0.0 for x in lowers], [x + 0.0 for x in uppers], lefts))
+    compact, compact_size = measure(lambda: P.Interval.from_arrays(lowers, uppers, lefts).compact())
+    assert compact == interval
+
+    other = P.Interval.from_arrays([x + 0.5 for x in lowers], [x + 0.5 for x in uppers])
+    print('n={} atomic intervals'.format(len(interval)))
+    print('  {:<10} {:>14} {:>10} {:>10} {:>10}'.format('', 'per atomic', 'union', 'contains', 'clip'))
+    for name, i, memory in [('tuples', interval, size), ('compact', compact, compact_size)]:
+        print('  {:<10} {:8.1f} bytes {:7.1f} ms {:7.3f} ms {:7.3f} ms'.format(
+            name, memory / len(i),
+            timeit(lambda: i | other) * 1000,
+            timeit(lambda: [x in i for x in lowers[::1000]]) * 1000,
+            timeit(lambda: i.clip(P.closed(n, n + 100))) * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
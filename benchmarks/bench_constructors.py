@@ -0,0 +1,32 @@
+"""
+Benchmark the creation of intervals, in nanoseconds per call.
+
+Usage: python -m benchmarks.bench_constructors [n]
+"""
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def main(n=100000):
+    a, b = P.closed(0, 1), P.closed(2, 3)
+    cases = [
+        ('P.empty()', lambda: P.empty()),
+        ('P.Interval()', lambda: P.Interval()),
+        ('P.closed(0, 1)', lambda: P.closed(0, 1)),
+        ('P.closed(1, 0)', lambda: P.closed(1, 0)),
+        ('P.closed(0, inf)', lambda: P.closed(0, P.inf)),
+        ('P.open(0, 1)', lambda: P.open(0, 1)),
+        ('P.singleton(0)', lambda: P.singleton(0)),
+        ('a & b (empty)', lambda: a & b),
+    ]
+
+    print('n={} calls'.format(n))
+    for name, func in cases:
+        print('  {:<18} {:8.0f} ns'.format(name, timeit(func, number=n) * 1e9))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,36 @@
+"""
+Benchmark the computation of how many of n intervals cover each value, either by
+folding IntervalDict.combine with operator.add, or with P.coverage.
+
+Usage: python -m benchmarks.bench_coverage [n]
+"""
+import operator
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def fold(intervals):
+    result = P.IntervalDict()
+    for interval in intervals:
+        result = result.combine(P.IntervalDict([(interval, 1)]), operator.add)
+    return result
+
+
+def main(n=500):
+    rnd = random.Random(42)
+    lowers = [rnd.uniform(0, 100) for _ in range(n)]
+    intervals = [P.closedopen(lower, lower + rnd.uniform(1, 10)) for lower in lowers]
+    assert fold(intervals) == P.coverage(intervals)
+
+    print('n={}'.format(n))
+    print('  {:<10} {:8.3f} s'.format('combine', timeit(lambda: fold(intervals), repeat=1)))
+    print('  {:<10} {:8.3f} s'.format('coverage', timeit(lambda: P.coverage(intervals), repeat=3)))
+    print('  {:<10} {:8.3f} s'.format('at_least', timeit(lambda: P.at_least(intervals, 10), repeat=3)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,47 @@
+"""
+Benchmark the creation of an interval from n rows of bounds, either with one
+Interval.from_atomic call per row, or with a single Interval.from_arrays call
+(with shuffled and presorted rows, from lists and from numpy arrays if available).
+
+Usage: python -m benchmarks.bench_from_arrays [n]
+"""
+import random
+import sys
+
+import portion as P
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from ._util import timeit
+
+
+def main(n=1000000):
+    rnd = random.Random(42)
+    lowers = [rnd.uniform(0, n) for _ in range(n)]
+    uppers = [lower + rnd.uniform(-0.5, 3) for lower in lowers]  # Some rows are empty
+    rows = sorted(zip(lowers, uppers))
+    # New float objects, allocated in order as if they were read from a sorted source
+    sorted_lowers, sorted_uppers = [r[0] + 0.0 for r in rows], [r[1] + 0.0 for r in rows]
+
+    workloads = [
+        ('from_atomic', lambda: P.Interval(*[
+            P.Interval.from_atomic(P.CLOSED, lower, upper, P.OPEN) for lower, upper in zip(lowers, uppers)
+        ])),
+        ('from_arrays', lambda: P.Interval.from_arrays(lowers, uppers, P.CLOSED, P.OPEN)),
+        ('presorted', lambda: P.Interval.from_arrays(
+            sorted_lowers, sorted_uppers, P.CLOSED, P.OPEN, presorted=True)),
+    ]
+    if numpy is not None:
+        array_lowers, array_uppers = numpy.array(lowers), numpy.array(uppers)
+        workloads.append(('numpy', lambda: P.Interval.from_arrays(array_lowers, array_uppers, P.CLOSED, P.OPEN)))
+
+    print('n={}'.format(n))
+    for name, workload in workloads:
+        print('  {:<12} {:8.3f} s'.format(name, timeit(workload, repeat=3)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,47 @@
+"""
+Benchmark stabbing and range queries over n intervals, either by testing every interval,
+or with P.IntervalIndex.
+
+Usage: python -m benchmarks.bench_index [n] [queries]
+"""
+import random
+import sys
+import time
+
+import portion as P
+
+from ._util import timeit
+
+
+def main(n=200000, queries=100):
+    rnd = random.Random(42)
+    intervals = []
+    for _ in range(n):
+        lower = rnd.uniform(0, n)
+        interval = P.closedopen(lower, lower + rnd.uniform(1, 20))
+        if rnd.random() < 0.1:
+            interval = interval | P.closed(lower + 50, lower + 60)
+        intervals.append(interval)
+
+    values = [rnd.uniform(0, n) for _ in range(queries)]
+    ranges = [P.closed(value, value + 10) for value in values]
+
+    start = time.perf_counter()
+    index = P.IntervalIndex(intervals)
+    print('n={}, build: {:.3f} s'.format(n, time.perf_counter() - start))
+
+    assert index.containing(values[0]) == [k for k, i in enumerate(intervals) if values[0] in i]
+    assert index.overlapping(ranges[0]) == [k for k, i in enumerate(intervals) if i.overlaps(ranges[0])]
+
+    scan = timeit(lambda: [[k for k, i in enumerate(intervals) if value in i] for value in values[:5]], repeat=1)
+    print('  {:<22} {:10.3f} ms/query'.format('containing (scan)', scan / 5 * 1000))
+    print('  {:<22} {:10.3f} ms/query'.format('containing (index)', timeit(
+        lambda: [index.containing(value) for value in values], repeat=3) / queries * 1000))
+    scan = timeit(lambda: [[k for k, i in enumerate(intervals) if i.overlaps(r)] for r in ranges[:5]], repeat=1)
+    print('  {:<22} {:10.3f} ms/query'.format('overlapping (scan)', scan / 5 * 1000))
+    print('  {:<22} {:10.3f} ms/query'.format('overlapping (index)', timeit(
+        lambda: [index.overlapping(r) for r in ranges], repeat=3) / queries * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]))
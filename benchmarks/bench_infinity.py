@@ -0,0 +1,53 @@
+"""
+Benchmark operations on intervals with unbounded atomic intervals, either with the
+default infinities or with the float infinity (see PORTION_FLOAT_INF in portion.const).
+
+Each mode runs in its own process, as the infinity is chosen when portion is imported.
+
+Usage: python -m benchmarks.bench_infinity [n]
+"""
+import os
+import random
+import subprocess
+import sys
+
+from ._util import timeit
+
+
+def bench(n, tolerance, repeat=7):
+    import portion as P
+
+    if tolerance:
+        P.set_tolerance(0, 1e-9)
+
+    rnd = random.Random(42)
+    values = [rnd.uniform(0, 1000) for _ in range(n)]
+    rays = [(P.openclosed(-P.inf, x), P.closedopen(x + 1, P.inf)) for x in values]
+    intervals = [left | right for left, right in rays]
+    others = [~i for i in intervals]
+
+    workloads = [
+        ('creation', lambda: [P.openclosed(-P.inf, x) | P.closedopen(x + 1, P.inf) for x in values]),
+        ('intersection', lambda: [a & b for a, b in zip(intervals, reversed(intervals))]),
+        ('union', lambda: [a | b for a, b in zip(intervals, others)]),
+        ('complement', lambda: [~a for a in intervals]),
+        ('containment', lambda: [x in a for x, a in zip(values, reversed(intervals))]),
+        ('comparison', lambda: [a < b for a, b in rays]),
+    ]
+
+    for name, workload in workloads:
+        print('  {:<12} {:8.3f} s'.format(name, timeit(workload, repeat=repeat)))
+
+
+def main(n=100000):
+    for tolerance in [False, True]:
+        for name, flag in [('default infinities', '0'), ('float infinity', '1')]:
+            print('{}, {} (n={})'.format(name, 'with tolerance' if tolerance else 'exact', n))
+            sys.stdout.flush()
+            env = dict(os.environ, PORTION_FLOAT_INF=flag)
+            code = 'from benchmarks.bench_infinity import bench; bench({}, {})'.format(n, tolerance)
+            subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,34 @@
+"""
+Benchmark the computation of all the pairs of overlapping intervals between two
+collections of n intervals, either by testing every pair with Interval.overlaps,
+or with P.join.
+
+Usage: python -m benchmarks.bench_join [n]
+"""
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def intervals(rnd, n):
+    lowers = [rnd.uniform(0, n) for _ in range(n)]
+    return [P.closedopen(lower, lower + rnd.uniform(0.5, 5)) for lower in lowers]
+
+
+def main(n=2000):
+    rnd = random.Random(42)
+    bookings, outages = intervals(rnd, n), intervals(rnd, n)
+    pairs = [(i, j) for i, a in enumerate(bookings) for j, b in enumerate(outages) if a.overlaps(b)]
+    assert sorted(P.join(bookings, outages)) == pairs
+
+    print('n={}, {} overlapping pairs'.format(n, len(pairs)))
+    print('  {:<10} {:8.3f} s'.format('overlaps', timeit(
+        lambda: [(i, j) for i, a in enumerate(bookings) for j, b in enumerate(outages) if a.overlaps(b)], repeat=1)))
+    print('  {:<10} {:8.3f} s'.format('join', timeit(lambda: list(P.join(bookings, outages)), repeat=3)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
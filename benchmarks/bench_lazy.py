@@ -0,0 +1,50 @@
+"""
+Benchmark the evaluation of set expressions with many leaves, either eagerly (one
+intermediate interval per operator) or lazily with P.lazy (a single sweep).
+
+Each expression combines n leaves with randomly chosen operators, and each leaf
+has m atomic intervals.
+
+Usage: python -m benchmarks.bench_lazy [n] [m]
+"""
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def leaf(rnd, m):
+    lowers = [rnd.uniform(0, m) for _ in range(m)]
+    return P.Interval.from_arrays(lowers, [lower + rnd.uniform(0, 1) for lower in lowers])
+
+
+def expression(leaves, operators):
+    result = leaves[0]
+    for operand, operator in zip(leaves[1:], operators):
+        if operator == '|':
+            result = result | operand
+        elif operator == '&':
+            result = result & ~operand
+        elif operator == '-':
+            result = result - operand
+        else:
+            result = result ^ operand
+    return result
+
+
+def main(n=30, m=100):
+    rnd = random.Random(42)
+    leaves = [leaf(rnd, m) for _ in range(n)]
+    operators = [rnd.choice('|&-^') for _ in range(n - 1)]
+    assert expression(leaves, operators) == expression([P.lazy(i) for i in leaves], operators).evaluate()
+
+    print('n={} leaves, m={} atomic intervals per leaf'.format(n, m))
+    print('  {:<8} {:8.3f} ms'.format('eager', timeit(lambda: expression(leaves, operators)) * 1000))
+    print('  {:<8} {:8.3f} ms'.format('lazy', timeit(
+        lambda: expression([P.lazy(i) for i in leaves], operators).evaluate()) * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]))
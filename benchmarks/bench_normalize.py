@@ -0,0 +1,46 @@
+"""
+Benchmark the normalization performed by Interval.__init__.
+
+It builds the union of n overlapping windows (so that most of them have to be
+merged) for increasing values of n, under both the classic and the fuzzy
+comparison operators, and reports the time spent per atomic interval.
+A roughly constant time per interval indicates (quasi-)linear scaling.
+
+Usage: python -m benchmarks.bench_normalize [max_exponent]
+"""
+import random
+import sys
+
+import portion as P
+from portion.fuzzy_operator import ClassicOperator, FuzzyOperator
+
+from ._util import timeit
+
+
+def windows(n, seed=42):
+    rnd = random.Random(seed)
+    result = []
+    for _ in range(n):
+        lower = rnd.uniform(0, n)
+        result.append(P.closedopen(lower, lower + rnd.uniform(0.5, 3)))
+    return result
+
+
+def bench(n, repeat=3):
+    pieces = windows(n)
+    return timeit(lambda: P.Interval(*pieces), repeat=repeat)
+
+
+def main(max_exponent=6):
+    for name, operator in [('classic', ClassicOperator()), ('fuzzy', FuzzyOperator(1e-9, 1e-12))]:
+        P.set_operator(operator)
+        print('{} operator'.format(name))
+        for exponent in range(3, max_exponent + 1):
+            n = 10 ** exponent
+            duration = bench(n, repeat=3 if exponent < 6 else 1)
+            print('  n=10^{}: {:9.3f} s  {:6.3f} us/interval'.format(exponent, duration, duration / n * 1e6))
+    P.set_operator(ClassicOperator())
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,39 @@
+"""
+Benchmark the size and round-trip time of pickled intervals and IntervalDict with
+n atomic intervals, either with their atomic intervals as named tuples (as before)
+or with packed bounds and boundaries.
+
+Usage: python -m benchmarks.bench_pickle [n]
+"""
+import pickle
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def report(name, obj):
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    duration = timeit(lambda: pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)))
+    print('  {:<14} {:10d} bytes {:8.1f} ms'.format(name, len(payload), duration * 1000))
+
+
+def main(n=100000):
+    rnd = random.Random(42)
+    lowers = sorted(rnd.uniform(0, 10 * n) for _ in range(n))
+    uppers = [lower + rnd.uniform(0, 1) for lower in lowers]
+    interval = P.Interval.from_arrays(lowers, uppers)
+    interval = interval | P.closed(-P.inf, -1.0)
+    d = P.IntervalDict((P.Interval.from_arrays(lowers[k::100], uppers[k::100]), k) for k in range(100))
+
+    print('n={} atomic intervals'.format(len(interval)))
+    report('atomics', interval.__getstate__())
+    report('interval', interval)
+    report('dict items', [(key.__getstate__(), value) for key, value in d.items()])
+    report('dict', d)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
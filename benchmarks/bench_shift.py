@@ -0,0 +1,38 @@
+"""
+Benchmark shifting and scaling an interval with n atomic intervals, either with
+apply and replace (one interval per atomic interval, sorted and merged again),
+or with shift and scale (a single linear pass).
+
+Usage: python -m benchmarks.bench_shift [n]
+"""
+import random
+import sys
+
+import portion as P
+
+from ._util import timeit
+
+
+def main(n=10000):
+    rnd = random.Random(42)
+    lowers = sorted(rnd.uniform(0, 10 * n) for _ in range(n))
+    interval = P.Interval.from_arrays(lowers, [lower + rnd.uniform(0, 1) for lower in lowers])
+
+    def apply_shift():
+        return interval.apply(lambda s: s.replace(lower=lambda v: v + 3.5, upper=lambda v: v + 3.5))
+
+    def apply_scale():
+        return interval.apply(lambda s: P.Interval.from_atomic(s.right, -2 * s.upper, -2 * s.lower, s.left))
+
+    assert apply_shift() == interval.shift(3.5)
+    assert apply_scale() == interval.scale(-2)
+
+    print('n={} atomic intervals'.format(len(interval)))
+    print('  {:<12} {:8.3f} ms'.format('apply shift', timeit(apply_shift) * 1000))
+    print('  {:<12} {:8.3f} ms'.format('shift', timeit(lambda: interval.shift(3.5)) * 1000))
+    print('  {:<12} {:8.3f} ms'.format('apply scale', timeit(apply_scale) * 1000))
+    print('  {:<12} {:8.3f} ms'.format('scale', timeit(lambda: interval.scale(-2)) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
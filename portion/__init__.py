@@ -1,18 +1,25 @@
 from .const import Bound, inf
-from .interval import Interval, open, closed, openclosed, closedopen, empty, singleton, set_tolerance
-from .func import iterate
+from .interval import (
+    Interval, open, closed, openclosed, closedopen, empty, singleton,
+    set_operator, set_tolerance, get_operator, tolerance,
+)
+from .func import iterate, union_all, intersection_all, coverage, at_least, at_most, join
 from .io import from_string, to_string, from_data, to_data
 from .dict import IntervalDict
+from .index import IntervalIndex
+from .columnar import ArrayInterval
+from .expression import lazy, LazyInterval
 
 
 __all__ = [
     'inf', 'CLOSED', 'OPEN',
     'Interval',
     'open', 'closed', 'openclosed', 'closedopen', 'singleton', 'empty',
-    'set_tolerance', 'set_operator',
-    'iterate',
+    'set_tolerance', 'set_operator', 'get_operator', 'tolerance',
+    'iterate', 'union_all', 'intersection_all', 'coverage', 'at_least', 'at_most', 'join',
     'from_string', 'to_string', 'from_data', 'to_data',
-    'IntervalDict',
+    'IntervalDict', 'IntervalIndex', 'ArrayInterval',
+    'lazy', 'LazyInterval',
 ]
 
 CLOSED = Bound.CLOSED
@@ -0,0 +1,332 @@
+from .const import Bound, inf
+from .interval import Atomic, Interval, _boundaries, _simplify
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _sweep(operands, how):
+    """
+    Combine sets of atomic intervals with a single sweep over their sorted bounds.
+
+    Bounds are mapped to (value, flag) keys as in portion.interval._sweep_events,
+    flags being Booleans. Counting, for each operand, the atomic intervals that
+    start and end up to a given key provides the (multi-)membership of the
+    range of values that follows that key.
+
+    :param operands: a list of (lowers, uppers, lefts, rights) arrays.
+    :param how: function that receives a list of count arrays (one per operand)
+        and returns a boolean array stating which ranges belong to the result.
+    :return: a (lowers, uppers, lefts, rights) tuple of arrays.
+    """
+    values, flags, deltas = [], [], []
+
+    for lowers, uppers, lefts, rights in operands:
+        values.extend([lowers, uppers])
+        flags.extend([~lefts, rights])
+
+    # Bounds of the universe, (-inf, +inf)
+    values.append(numpy.array([-numpy.inf, numpy.inf]))
+    flags.append(numpy.array([True, False]))
+
+    values = numpy.concatenate(values)
+    flags = numpy.concatenate(flags)
+    order = numpy.lexsort((flags, values))
+    values, flags = values[order], flags[order]
+
+    start = 0
+    for lowers, _, _, _ in operands:
+        delta = numpy.zeros(len(values), dtype=numpy.int64)
+        delta[start:start + len(lowers)] = 1
+        delta[start + len(lowers):start + 2 * len(lowers)] = -1
+        deltas.append(numpy.cumsum(delta[order]))
+        start += 2 * len(lowers)
+
+    # Keep the last position of each distinct key, i.e. the state after that key
+    last = numpy.ones(len(values), dtype=bool)
+    last[:-1] = (values[1:] != values[:-1]) | (flags[1:] != flags[:-1])
+    values, flags = values[last], flags[last]
+
+    inside = how([counts[last] for counts in deltas])
+    inside &= values < numpy.inf
+    before = numpy.concatenate(([False], inside[:-1]))
+
+    starts = inside & ~before
+    ends = ~inside & before
+    return values[starts], values[ends], ~flags[starts], flags[ends]
+
+
+class ArrayInterval:
+    """
+    This class represents an interval, as a (automatically simplified) union of atomic
+    intervals whose bounds are stored in numpy arrays.
+
+    It is meant for interval sets with a very large number of atomic intervals, and
+    provides vectorized union, intersection, complement, (symmetric) difference and containment.
+    Bounds are converted to floats, and are compared exactly, ie. the tolerance
+    of the current operator is not taken into account.
+
+    An ArrayInterval can be converted to and from an Interval using ArrayInterval.from_interval()
+    and ArrayInterval.to_interval(). This class requires numpy.
+    """
+
+    __slots__ = ('_lowers', '_uppers', '_lefts', '_rights')
+
+    def __init__(self, lowers=(), uppers=(), lefts=Bound.CLOSED, rights=Bound.CLOSED):
+        """
+        Create a union of atomic intervals from their bounds.
+
+        Boundaries can be provided either as sequences or as single values, in which case
+        they apply to all atomic intervals. They are either CLOSED and OPEN, or Booleans
+        (True standing for CLOSED). Empty atomic intervals are ignored.
+
+        :param lowers: values of the lower bounds.
+        :param uppers: values of the upper bounds.
+        :param lefts: left boundaries (default is CLOSED).
+        :param rights: right boundaries (default is CLOSED).
+        """
+        if numpy is None:
+            raise ImportError('ArrayInterval requires numpy.')
+
+        lowers = numpy.asarray(lowers, dtype=float).ravel()
+        uppers = numpy.asarray(uppers, dtype=float).ravel()
+        if len(lowers) != len(uppers):
+            raise ValueError('Lower and upper bounds must have the same length.')
+        if numpy.isnan(lowers).any() or numpy.isnan(uppers).any():
+            raise ValueError('Bounds cannot be NaN.')
+
+        lefts = numpy.array(_boundaries(lefts, len(lowers), closed=True), dtype=bool) & numpy.isfinite(lowers)
+        rights = numpy.array(_boundaries(rights, len(uppers), closed=True), dtype=bool) & numpy.isfinite(uppers)
+
+        nonempty = (lowers < uppers) | ((lowers == uppers) & lefts & rights)
+        operand = (lowers[nonempty], uppers[nonempty], lefts[nonempty], rights[nonempty])
+
+        self._set(*_sweep([operand], lambda counts: counts[0] > 0))
+
+    def _set(self, lowers, uppers, lefts, rights):
+        for array in (lowers, uppers, lefts, rights):
+            array.flags.writeable = False
+        self._lowers, self._uppers, self._lefts, self._rights = lowers, uppers, lefts, rights
+
+    @staticmethod
+    def _from_arrays(lowers, uppers, lefts, rights):
+        """
+        Create an ArrayInterval from arrays describing atomic intervals that are
+        sorted, disjoint, non-adjacent and non-empty. No check is performed.
+        """
+        instance = ArrayInterval.__new__(ArrayInterval)
+        instance._set(lowers, uppers, lefts, rights)
+        return instance
+
+    @staticmethod
+    def from_interval(interval):
+        """
+        Create an ArrayInterval from an Interval instance.
+
+        :param interval: an interval.
+        :return: an ArrayInterval instance.
+        """
+        if numpy is None:
+            raise ImportError('ArrayInterval requires numpy.')
+
+        if interval.empty:
+            return ArrayInterval()
+
+        atomics = interval.atomics()
+        return ArrayInterval._from_arrays(
+            numpy.array([i.lower for i in atomics], dtype=float),
+            numpy.array([i.upper for i in atomics], dtype=float),
+            numpy.array([i.left is Bound.CLOSED for i in atomics], dtype=bool),
+            numpy.array([i.right is Bound.CLOSED for i in atomics], dtype=bool),
+        )
+
+    def to_interval(self):
+        """
+        Convert this ArrayInterval to an Interval instance.
+
+        As bounds of an ArrayInterval are compared exactly, its atomic intervals can be
+        empty or adjacent for the tolerance of the current operator (if any). They are
+        then dropped or merged accordingly.
+
+        :return: an Interval instance.
+        """
+        atomics = [
+            Atomic(
+                Bound.CLOSED if left else Bound.OPEN,
+                -inf if lower == -numpy.inf else lower,
+                inf if upper == numpy.inf else upper,
+                Bound.CLOSED if right else Bound.OPEN,
+            )
+            for lower, upper, left, right in zip(
+                self._lowers.tolist(), self._uppers.tolist(), self._lefts.tolist(), self._rights.tolist()
+            )
+        ]
+        return Interval._from_atomics(_simplify(atomics, exact=True))
+
+    @property
+    def lowers(self):
+        """
+        Read-only array of the lower bounds of the atomic intervals.
+        """
+        return self._lowers
+
+    @property
+    def uppers(self):
+        """
+        Read-only array of the upper bounds of the atomic intervals.
+        """
+        return self._uppers
+
+    @property
+    def lefts(self):
+        """
+        Read-only array of the left boundaries of the atomic intervals (True if CLOSED).
+        """
+        return self._lefts
+
+    @property
+    def rights(self):
+        """
+        Read-only array of the right boundaries of the atomic intervals (True if CLOSED).
+        """
+        return self._rights
+
+    @property
+    def empty(self):
+        """
+        True if interval is empty, False otherwise.
+        """
+        return len(self._lowers) == 0
+
+    def _arrays(self):
+        return self._lowers, self._uppers, self._lefts, self._rights
+
+    def _combine(self, other, how, reflected=False):
+        if isinstance(other, Interval):
+            other = ArrayInterval.from_interval(other)
+        elif not isinstance(other, ArrayInterval):
+            return NotImplemented
+        operands = [other._arrays(), self._arrays()] if reflected else [self._arrays(), other._arrays()]
+        return ArrayInterval._from_arrays(*_sweep(operands, how))
+
+    def union(self, other):
+        """
+        Return the union of two intervals.
+
+        :param other: an ArrayInterval or an Interval.
+        :return: an ArrayInterval instance.
+        """
+        return self | other
+
+    def intersection(self, other):
+        """
+        Return the intersection of two intervals.
+
+        :param other: an ArrayInterval or an Interval.
+        :return: an ArrayInterval instance.
+        """
+        return self & other
+
+    def difference(self, other):
+        """
+        Return the difference of two intervals.
+
+        :param other: an ArrayInterval or an Interval.
+        :return: an ArrayInterval instance.
+        """
+        return self - other
+
+    def symmetric_difference(self, other):
+        """
+        Return the symmetric difference of two intervals.
+
+        :param other: an ArrayInterval or an Interval.
+        :return: an ArrayInterval instance.
+        """
+        return self ^ other
+
+    def complement(self):
+        """
+        Return the complement of this interval.
+
+        :return: an ArrayInterval instance.
+        """
+        return ~self
+
+    def contains(self, item):
+        """
+        Test if given item is contained in this interval.
+
+        :param item: a value, an ArrayInterval or an Interval.
+        :return: True if given item is contained, False otherwise.
+        """
+        return item in self
+
+    def contains_many(self, values):
+        """
+        Test which of given values are contained in this interval.
+
+        :param values: a sequence or a numpy array of values.
+        :return: a numpy array of booleans, with the same shape than values.
+        """
+        values = numpy.asarray(values, dtype=float)
+        if len(self._lowers) == 0:
+            return numpy.zeros(values.shape, dtype=bool)
+
+        index = numpy.searchsorted(self._lowers, values, side='right') - 1
+        valid = index >= 0
+        index = numpy.clip(index, 0, len(self._lowers) - 1)
+
+        lower, upper = self._lowers[index], self._uppers[index]
+        left = (values > lower) | ((values == lower) & self._lefts[index])
+        right = (values < upper) | ((values == upper) & self._rights[index])
+        return valid & left & right
+
+    def __len__(self):
+        return len(self._lowers)
+
+    def __or__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) | (counts[1] > 0))
+
+    def __ror__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) | (counts[1] > 0), reflected=True)
+
+    def __and__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) & (counts[1] > 0))
+
+    def __rand__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) & (counts[1] > 0), reflected=True)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) & (counts[1] == 0))
+
+    def __rsub__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) & (counts[1] == 0), reflected=True)
+
+    def __xor__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) != (counts[1] > 0))
+
+    def __rxor__(self, other):
+        return self._combine(other, lambda counts: (counts[0] > 0) != (counts[1] > 0), reflected=True)
+
+    def __invert__(self):
+        return ArrayInterval._from_arrays(*_sweep([self._arrays()], lambda counts: counts[0] == 0))
+
+    def __contains__(self, item):
+        if isinstance(item, Interval):
+            item = ArrayInterval.from_interval(item)
+        if isinstance(item, ArrayInterval):
+            return (item - self).empty
+        return bool(self.contains_many([item])[0])
+
+    def __eq__(self, other):
+        if isinstance(other, Interval):
+            other = ArrayInterval.from_interval(other)
+        if isinstance(other, ArrayInterval):
+            return all(numpy.array_equal(a, b) for a, b in zip(self._arrays(), other._arrays()))
+        return NotImplemented
+
+    def __repr__(self):
+        return 'ArrayInterval({!r})'.format(self.to_interval())
@@ -1,4 +1,5 @@
 import enum
+import os
 
 
 class Bound(enum.Enum):
@@ -81,6 +82,10 @@ class _NInf(_Singleton):
     def __hash__(self): return hash(float('-inf'))
 
 
-# Positive infinity
-inf = _PInf()
-#inf = float('inf')
+# Positive infinity. If the PORTION_FLOAT_INF environment variable is set (to anything but
+# an empty string or 0) when portion is imported, the float infinity is used instead. It is
+# compared natively (hence faster), but only with numbers.
+if os.environ.get('PORTION_FLOAT_INF', '0') not in ('', '0'):
+    inf = float('inf')
+else:
+    inf = _PInf()
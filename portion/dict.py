@@ -1,5 +1,5 @@
 from .const import Bound
-from .interval import Interval, singleton
+from .interval import Interval, singleton, _before, _pack, _unpack
 
 from collections.abc import MutableMapping, Mapping
 
@@ -10,6 +10,25 @@ def _sort(i):
     return (i[0].lower, i[0].left is Bound.CLOSED, i[0].upper, i[0].right is Bound.OPEN)
 
 
+def _unpickle(cls, values, keys, bounds=None, flags=None):
+    """
+    Create an instance of given IntervalDict class from its values and keys (see
+    IntervalDict.__reduce__). If the keys are packed, the number of atomic intervals
+    of each key is given instead of the keys themselves.
+    """
+    if bounds is not None:
+        atomics = _unpack(bounds, flags)
+        sizes, keys, start = keys, [], 0
+        for size in sizes:
+            keys.append(Interval._from_atomics(atomics[start:start + size]))
+            start += size
+
+    new_dict = cls.__new__(cls)
+    new_dict._storage = SortedDict(_sort)
+    new_dict._storage.update(zip(keys, values))
+    return new_dict
+
+
 class IntervalDict(MutableMapping):
     """
     An IntervalDict is a dict-like data structure that maps from intervals to data,
@@ -232,6 +251,55 @@ class IntervalDict(MutableMapping):
 
         return IntervalDict(new_items)
 
+    def apply_monotone(self, func, *, decreasing=False):
+        """
+        Return a new IntervalDict whose keys are obtained by applying a strictly
+        monotonic function on the bounds of current keys. See Interval.apply_monotone.
+
+        :param func: function to apply on each finite bound.
+        :param decreasing: set to True if given function is decreasing (default is False).
+        :return: a new IntervalDict instance.
+        """
+        items = []
+        for key, value in self._storage.items():
+            key = key.apply_monotone(func, decreasing=decreasing)
+            if not key.empty:
+                items.append((key, value))
+
+        # Storage is filled directly if keys are still disjoint and non-adjacent, which
+        # is not the case if rounding errors (or the tolerance) made some bounds equal.
+        atomics = sorted(
+            (atomic for key, _ in items for atomic in key._intervals),
+            key=lambda atomic: (atomic.lower, atomic.left is Bound.OPEN),
+        )
+        new_dict = IntervalDict()
+        if all(_before(a, b) for a, b in zip(atomics, atomics[1:])):
+            new_dict._storage.update(items)
+        else:
+            for key, value in items:
+                new_dict[key] = value
+        return new_dict
+
+    def shift(self, delta):
+        """
+        Return a new IntervalDict whose keys are shifted by given value.
+
+        :param delta: value to add to the bounds of the keys.
+        :return: a new IntervalDict instance.
+        """
+        return self.apply_monotone(lambda value: value + delta)
+
+    def scale(self, factor):
+        """
+        Return a new IntervalDict whose keys are multiplied by given (non-zero) factor.
+
+        :param factor: non-zero value by which the bounds of the keys are multiplied.
+        :return: a new IntervalDict instance.
+        """
+        if factor == 0:
+            raise ValueError('Scaling factor cannot be zero.')
+        return self.apply_monotone(lambda value: value * factor, decreasing=factor < 0)
+
     def as_dict(self):
         """
         Return the content as a classical Python dict.
@@ -240,6 +308,15 @@ class IntervalDict(MutableMapping):
         """
         return dict(self._storage)
 
+    def __reduce__(self):
+        # Keys are packed together (see Interval.__reduce__), with the number of
+        # atomic intervals of each key.
+        keys, values = list(self._storage.keys()), list(self._storage.values())
+        packed = _pack(keys)
+        if packed is None:
+            return _unpickle, (type(self), values, keys)
+        return _unpickle, (type(self), values, [len(key) for key in keys]) + packed
+
     def __getitem__(self, key):
         if isinstance(key, Interval):
             items = []
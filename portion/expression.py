@@ -0,0 +1,217 @@
+import operator
+
+from .const import inf
+from .fuzzy_operator import ClassicOperator
+from .interval import Interval, get_operator, _key_range, _sweep_events
+
+
+def lazy(interval):
+    """
+    Wrap given interval in a lazy expression.
+
+    Set operations (|, &, -, ^ and ~) on the returned LazyInterval are recorded instead
+    of being computed, and the resulting expression is only evaluated when calling
+    its evaluate() method.
+
+    :param interval: an interval.
+    :return: a LazyInterval instance.
+    """
+    if isinstance(interval, LazyInterval):
+        return interval
+    if not isinstance(interval, Interval):
+        raise TypeError('Parameter must be an Interval instance')
+    return LazyInterval(None, (interval,))
+
+
+# Symbols (for representation) and eager counterparts of supported operations
+_OPERATIONS = {
+    'or': ('|', operator.or_),
+    'and': ('&', operator.and_),
+    'sub': ('-', operator.sub),
+    'xor': ('^', operator.xor),
+}
+
+
+def _evaluate(operation, first, second):
+    """
+    Return whether a position belongs to the result of given operation, given whether
+    it belongs to its operands (the second one is ignored for complements).
+    """
+    if operation == 'or':
+        return first or second
+    elif operation == 'and':
+        return first and second
+    elif operation == 'sub':
+        return first and not second
+    elif operation == 'xor':
+        return first != second
+    return not first
+
+
+class LazyInterval:
+    """
+    This class represents a lazy expression over intervals, ie. a tree of set operations
+    whose leaves are Interval instances. It is created with portion.lazy().
+
+    The whole expression is evaluated in a single sweep over the (sorted) bounds of all
+    its leaves, without computing any intermediate interval. When a tolerance is set
+    (see set_tolerance), bounds cannot be compared exactly, and the expression is
+    evaluated eagerly instead.
+    """
+
+    __slots__ = ('_operation', '_operands')
+
+    def __init__(self, operation, operands):
+        # Leaves have no operation, and their only operand is an Interval instance
+        self._operation = operation
+        self._operands = operands
+
+    def _combine(self, operation, other, reflected=False):
+        if isinstance(other, Interval):
+            other = lazy(other)
+        elif not isinstance(other, LazyInterval):
+            return NotImplemented
+        return LazyInterval(operation, (other, self) if reflected else (self, other))
+
+    def __or__(self, other):
+        return self._combine('or', other)
+
+    def __ror__(self, other):
+        return self._combine('or', other, reflected=True)
+
+    def __and__(self, other):
+        return self._combine('and', other)
+
+    def __rand__(self, other):
+        return self._combine('and', other, reflected=True)
+
+    def __sub__(self, other):
+        return self._combine('sub', other)
+
+    def __rsub__(self, other):
+        return self._combine('sub', other, reflected=True)
+
+    def __xor__(self, other):
+        return self._combine('xor', other)
+
+    def __rxor__(self, other):
+        return self._combine('xor', other, reflected=True)
+
+    def __invert__(self):
+        return LazyInterval('invert', (self,))
+
+    def leaves(self):
+        """
+        Return the distinct intervals this expression is made of.
+
+        :return: a list of Interval instances, in order of first appearance.
+        """
+        leaves = {}
+        self._compile(leaves, [], [])
+        return [interval for interval, _ in leaves.values()]
+
+    def _compile(self, leaves, nodes, parents):
+        """
+        Flatten this expression into a list of nodes, children first.
+
+        :param leaves: a dict mapping the id of each distinct leaf to a (leaf, node indices) pair.
+        :param nodes: a list of (operation, first child, second child) tuples, filled in place.
+            Leaves have no child, and complements have the same first and second child.
+        :param parents: a list of parent node indices (None for the root), filled in place.
+        :return: the index of the node corresponding to this expression.
+        """
+        if self._operation is None:
+            first = second = None
+        elif self._operation == 'invert':
+            first = second = self._operands[0]._compile(leaves, nodes, parents)
+        else:
+            first, second = (operand._compile(leaves, nodes, parents) for operand in self._operands)
+
+        index = len(nodes)
+        nodes.append((self._operation, first, second))
+        parents.append(None)
+
+        if self._operation is None:
+            interval = self._operands[0]
+            leaves.setdefault(id(interval), (interval, []))[1].append(index)
+        else:
+            parents[first] = parents[second] = index
+        return index
+
+    def _evaluate_eagerly(self):
+        if self._operation is None:
+            return self._operands[0]
+        if self._operation == 'invert':
+            return ~self._operands[0]._evaluate_eagerly()
+        return _OPERATIONS[self._operation][1](
+            self._operands[0]._evaluate_eagerly(), self._operands[1]._evaluate_eagerly()
+        )
+
+    def evaluate(self):
+        """
+        Evaluate this expression.
+
+        :return: an Interval instance.
+        """
+        if not isinstance(get_operator(), ClassicOperator):
+            return self._evaluate_eagerly()
+
+        leaves, nodes, parents = {}, [], []
+        root = self._compile(leaves, nodes, parents)
+        leaves = list(leaves.values())
+
+        # Whether the current position belongs to each node, starting before any leaf
+        values = []
+        for operation, first, second in nodes:
+            values.append(operation is not None and _evaluate(operation, values[first], values[second]))
+
+        # Result is built from ranges of (value, flag) keys, see _sweep_events
+        events = _sweep_events(interval._intervals for interval, _ in leaves)
+
+        result = []
+        start = (-inf, 1) if values[root] else None
+
+        def toggle(value, flag):
+            nonlocal start
+            if start is None:
+                start = (value, flag)
+            else:
+                # Initial range can be empty, i.e. [(-inf, 1), (-inf, 1))
+                if start != (value, flag):
+                    result.append(_key_range(start, (value, flag)))
+                start = None
+
+        current, current_value, current_flag = values[root], -inf, 1
+        for value, flag, index, delta in events:
+            # Check the result once all events sharing the previous key are processed
+            if flag != current_flag or value != current_value:
+                if values[root] != current:
+                    current = not current
+                    toggle(current_value, current_flag)
+                current_value, current_flag = value, flag
+
+            # Update the ancestors of the leaf, until their value does not change
+            for node in leaves[index][1]:
+                values[node] = delta > 0
+                node = parents[node]
+                while node is not None:
+                    operation, first, second = nodes[node]
+                    updated = _evaluate(operation, values[first], values[second])
+                    if updated == values[node]:
+                        break
+                    values[node] = updated
+                    node = parents[node]
+
+        if values[root] != current:
+            toggle(current_value, current_flag)
+        if start is not None and start[0] != inf:
+            toggle(inf, 0)
+
+        return Interval._from_atomics(result)
+
+    def __repr__(self):
+        if self._operation is None:
+            return 'lazy({!r})'.format(self._operands[0])
+        if self._operation == 'invert':
+            return '~{!r}'.format(self._operands[0])
+        return '({!r} {} {!r})'.format(self._operands[0], _OPERATIONS[self._operation][0], self._operands[1])
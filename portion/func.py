@@ -1,7 +1,13 @@
+import heapq
 import operator
 from functools import partial
 
-from .const import inf
+from .const import Bound, inf
+from .dict import IntervalDict
+from .fuzzy_operator import ClassicOperator
+from .interval import (
+    Interval, Atomic, empty, get_operator, _before, _empty, _intersection, _key_range, _normalize, _simplify, _sweep_events,
+)
 
 
 def iterate(interval, step, *, base=None, reverse=False):
@@ -37,6 +43,9 @@ def iterate(interval, step, *, base=None, reverse=False):
     include = operator.le if not reverse else operator.ge
     step = step if callable(step) else partial(operator.add, step)
 
+    if interval.empty:
+        return
+
     value = base(interval.lower if not reverse else interval.upper)
     if (value == -inf and not reverse) or (value == inf and reverse):
         raise ValueError('Cannot start iteration with infinity.')
@@ -50,3 +59,262 @@ def iterate(interval, step, *, base=None, reverse=False):
         while include(value, i):
             yield value
             value = step(value)
+
+
+def _atomics(intervals):
+    """
+    Return the lists of atomic intervals of given intervals.
+    """
+    result = []
+    for interval in intervals:
+        if not isinstance(interval, Interval):
+            raise TypeError('Parameters must be Interval instances')
+        result.append(interval._intervals)
+    return result
+
+
+def _merge_all(lists):
+    """
+    Merge lists of atomic intervals sorted by lower bound (closed first).
+
+    Sorting the concatenation of the lists amounts to a k-way merge, as the sorting
+    algorithm detects and merges the already sorted runs.
+    """
+    result = [atomic for atomics in lists for atomic in atomics]
+    result.sort(key=lambda i: (i.lower, i.left is Bound.OPEN))
+    return result
+
+
+def union_all(intervals):
+    """
+    Return the union of given intervals.
+
+    The atomic intervals of all given intervals are merged and simplified in
+    a single pass, which is much faster than successively computing the union
+    of each pair of intervals.
+
+    :param intervals: an iterable of intervals.
+    :return: the union of the intervals.
+    """
+    lists = [atomics for atomics in _atomics(intervals) if not _empty(atomics[0])]
+    if len(lists) == 0:
+        return empty()
+    if len(lists) == 1:
+        return Interval._from_atomics(lists[0])
+    return Interval._from_atomics(_normalize(_merge_all(lists)))
+
+
+def intersection_all(intervals):
+    """
+    Return the intersection of given intervals.
+
+    The atomic intervals of all given intervals are merged, and the intersection
+    is computed in a single pass over them, which is much faster than successively
+    computing the intersection of each pair of intervals. If no interval is given,
+    the interval (-inf, +inf) is returned.
+
+    :param intervals: an iterable of intervals.
+    :return: the intersection of the intervals.
+    """
+    lists = _atomics(intervals)
+    if len(lists) == 0:
+        return Interval._from_atomics([Atomic(Bound.OPEN, -inf, inf, Bound.OPEN)])
+    if any(_empty(atomics[0]) for atomics in lists):
+        return empty()
+    if len(lists) == 1:
+        return Interval._from_atomics(lists[0])
+
+    result = []
+    exact = isinstance(get_operator(), ClassicOperator)
+    # Atomic intervals that overlap the current lower bound, by upper bound (open ones first).
+    # As the atomic intervals of an interval are disjoint, there is at most one per interval.
+    active = []
+    for order, atomic in enumerate(_merge_all(lists)):
+        while active and _before(active[0][-1], atomic):
+            heapq.heappop(active)
+        heapq.heappush(active, (atomic.upper, atomic.right is Bound.CLOSED, order, atomic))
+
+        # Given atomic interval starts the last of the active ones, and the first active
+        # one ends the first. Their intersection is part of all given intervals. With fuzzy
+        # comparisons, lower bounds can be close, and all active ones have to be considered.
+        if len(active) == len(lists):
+            if exact:
+                intersection = _intersection(atomic, active[0][-1])
+            else:
+                intersection = atomic
+                for item in active:
+                    intersection = _intersection(intersection, item[-1])
+
+            if not _empty(intersection):
+                result.append(intersection)
+
+    return Interval._from_atomics(_normalize(result))
+
+
+def _regions(intervals):
+    """
+    Sweep over the bounds of given intervals, and yield the consecutive regions of
+    the whole domain that are covered by a constant number of intervals.
+
+    Regions are ranges of (value, flag) keys, see _sweep_events.
+
+    :param intervals: an iterable of intervals.
+    :return: an iterator of (start key, end key, count) triplets, sorted by key.
+    """
+    events = _sweep_events(_atomics(intervals))
+
+    start, count = (-inf, 1), 0
+    position = 0
+    while position < len(events):
+        value, flag, updated = events[position][0], events[position][1], count
+        while position < len(events) and events[position][1] == flag and events[position][0] == value:
+            updated += events[position][3]
+            position += 1
+
+        if updated != count:
+            # The first region is empty if an interval starts at -inf
+            if start != (value, flag):
+                yield start, (value, flag), count
+            start, count = (value, flag), updated
+
+    if start != (inf, 0):
+        yield start, (inf, 0), count
+
+
+def _from_regions(atomics):
+    """
+    Create an interval from sorted and disjoint regions. As the sweep compares bounds
+    exactly, regions can be empty or adjacent for the tolerance of the current
+    operator, in which case they are dropped or merged.
+    """
+    return Interval._from_atomics(_simplify(atomics, exact=True))
+
+
+def coverage(intervals):
+    """
+    Return how many of given intervals cover each value.
+
+    The result is computed with a single sweep over the sorted bounds of all given
+    intervals. Bounds are compared exactly during the sweep. When a tolerance is set,
+    the resulting regions are simplified accordingly.
+
+    :param intervals: an iterable of intervals.
+    :return: an IntervalDict mapping the covered regions to their number of intervals.
+    """
+    regions = {}
+    for start, end, count in _regions(intervals):
+        if count > 0:
+            regions.setdefault(count, []).append(_key_range(start, end))
+
+    # Regions sharing the same count are sorted and separated by other ones, hence
+    # disjoint and non-adjacent. Storage is filled directly, as __setitem__ is linear.
+    d = IntervalDict()
+    for count, atomics in regions.items():
+        key = _from_regions(atomics)
+        if not key.empty:
+            d._storage[key] = count
+    return d
+
+
+def _covered(intervals, predicate):
+    result = []
+    for start, end, count in _regions(intervals):
+        if predicate(count):
+            if result and result[-1][1] == start:
+                result[-1] = (result[-1][0], end)
+            else:
+                result.append((start, end))
+    return _from_regions([_key_range(start, end) for start, end in result])
+
+
+def at_least(intervals, k):
+    """
+    Return the values that are covered by at least k of given intervals.
+
+    See coverage for details.
+
+    :param intervals: an iterable of intervals.
+    :param k: minimal number of intervals.
+    :return: an interval.
+    """
+    return _covered(intervals, lambda count: count >= k)
+
+
+def at_most(intervals, k):
+    """
+    Return the values that are covered by at most k of given intervals, including
+    the ones that are not covered at all.
+
+    See coverage for details.
+
+    :param intervals: an iterable of intervals.
+    :param k: maximal number of intervals.
+    :return: an interval.
+    """
+    return _covered(intervals, lambda count: count <= k)
+
+
+def join(first, second, *, how=None):
+    """
+    Return the pairs of overlapping intervals from two collections.
+
+    Pairs are found with a single sweep over the sorted atomic intervals of both
+    collections, whose cost depends on the number of overlapping pairs rather than on
+    the number of possible pairs. Two intervals overlap if Interval.overlaps says so,
+    including when a tolerance is set.
+
+    :param first: an iterable of intervals.
+    :param second: an iterable of intervals.
+    :param how: optional function that is called with the intersection of
+        overlapping intervals.
+    :return: a lazy iterator of (i, j) pairs of indices, such that first[i] overlaps
+        second[j], or of (i, j, how(first[i] & second[j])) triplets if how is provided.
+    """
+    first, second = list(first), list(second)
+    lists = (_atomics(first), _atomics(second))
+
+    items = []
+    for side, owners in enumerate(lists):
+        for owner, atomics in enumerate(owners):
+            if not _empty(atomics[0]):
+                items.extend((atomic, side, owner) for atomic in atomics)
+    items.sort(key=lambda item: (item[0].lower, item[0].left is Bound.OPEN))
+
+    # A non-atomic interval can overlap another one several times
+    unique = all(len(atomics) == 1 for owners in lists for atomics in owners)
+    pairs = _join(items, get_operator(), unique)
+
+    if how is None:
+        return pairs
+    return ((i, j, how(first[i] & second[j])) for i, j in pairs)
+
+
+def _join(items, op, unique):
+    exact = isinstance(op, ClassicOperator)
+    seen = set()
+    # Atomic intervals of each side that overlap the current lower bound, by upper bound
+    # (open ones first). Active intervals of the other side overlap the current one.
+    active = ([], [])
+    for order, (atomic, side, owner) in enumerate(items):
+        for heap in active:
+            if exact:
+                while heap and _before(heap[0][-2], atomic):
+                    heapq.heappop(heap)
+            else:
+                # With fuzzy comparisons, an atomic interval that is before the current one
+                # can still overlap the next ones if their lower bounds are close.
+                while heap and op.cmp(heap[0][0], atomic.lower) < 0:
+                    heapq.heappop(heap)
+
+        for _, _, _, other, other_owner in active[1 - side]:
+            if not exact and (_before(atomic, other) or _before(other, atomic)):
+                continue
+
+            pair = (owner, other_owner) if side == 0 else (other_owner, owner)
+            if unique:
+                yield pair
+            elif pair not in seen:
+                seen.add(pair)
+                yield pair
+
+        heapq.heappush(active[side], (atomic.upper, atomic.right is Bound.CLOSED, order, atomic, owner))
@@ -30,6 +30,16 @@ class FuzzyOperator:
         return (a > b) and (not self.eq(a, b))
 
 
+    def cmp(self, a, b):
+        """
+        Three-way comparison: return -1 if a < b, 0 if a == b and 1 if a > b.
+        Values are compared with a single call to math.isclose.
+        """
+        if math.isclose(a, b, rel_tol=self.rel_tol, abs_tol=self.abs_tol):
+            return 0
+        return -1 if a < b else 1
+
+
 class ClassicOperator:
     # https://github.com/python/cpython/blob/3.8/Lib/operator.py
     @staticmethod
@@ -61,3 +71,33 @@ class ClassicOperator:
     def gt(a, b):
         "Same as a > b."
         return a > b
+
+    @staticmethod
+    def cmp(a, b):
+        "Return -1 if a < b, 0 if a == b and 1 if a > b."
+        if a < b:
+            return -1
+        return 0 if a == b else 1
+
+
+class QuantizedOperator(ClassicOperator):
+    """
+    Exact operator for bounds that are snapped to a grid whose step is the
+    absolute tolerance. Bounds are snapped once, when atomic intervals are
+    created, and are then compared exactly.
+    """
+
+    def __init__(self, abs_tol):
+        if not abs_tol > 0:
+            raise ValueError('Absolute tolerance must be positive.')
+        self.abs_tol = abs_tol
+        # Dividing by 1 / abs_tol gives nicer floats when abs_tol is e.g. 0.001
+        inverse = 1 / abs_tol
+        self._inverse = inverse if isinstance(abs_tol, float) and inverse.is_integer() else None
+
+    def snap(self, value):
+        "Return the multiple of abs_tol that is the closest to value (infinities are kept)."
+        if math.isinf(value):
+            return value
+        steps = round(value / self.abs_tol)
+        return steps / self._inverse if self._inverse else steps * self.abs_tol
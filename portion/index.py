@@ -0,0 +1,132 @@
+from bisect import bisect_left
+
+from .fuzzy_operator import ClassicOperator
+from .interval import Interval, get_operator, _before, _contains_value, _empty
+
+
+class IntervalIndex:
+    """
+    This class represents a static index over many intervals, to efficiently find the
+    ones that contain a given value, or that overlap a given interval.
+
+    The index is built once, and cannot be modified afterwards. It relies on a nested
+    containment list: the atomic intervals of all indexed intervals are sorted, and the
+    ones that are contained in another one are stored in a sublist of the latter. Queries
+    take O(log n + k) time, where k is the number of atomic intervals that are found.
+    Queries follow the semantics of Interval.contains and Interval.overlaps, including
+    when a tolerance is set.
+    """
+
+    __slots__ = ('_lists', '_size')
+
+    def __init__(self, intervals):
+        """
+        Create an index over given intervals.
+
+        :param intervals: an iterable of intervals.
+        """
+        items = []
+        size = 0
+        for owner, interval in enumerate(intervals):
+            if not isinstance(interval, Interval):
+                raise TypeError('Parameters must be Interval instances')
+            size += 1
+            if not interval.empty:
+                items.extend((atomic, owner) for atomic in interval._intervals)
+
+        # Sort by lower bound, and by decreasing upper bound for a same lower bound, so
+        # that containing atomic intervals come before the contained ones.
+        items.sort(key=lambda item: item[0].upper, reverse=True)
+        items.sort(key=lambda item: item[0].lower)
+
+        # Each list is a triplet of (upper bounds, entries, sublists), where entries are
+        # (atomic interval, owner) pairs, and sublists are the positions of the lists of
+        # the atomic intervals they contain (if any). As atomic intervals of a same list
+        # do not contain each other, they are sorted by both lower and upper bounds.
+        lists = [([], [], [])]
+        stack = []  # (list, position) of the current chain of containing atomic intervals
+        for atomic, owner in items:
+            while stack and lists[stack[-1][0]][0][stack[-1][1]] < atomic.upper:
+                stack.pop()
+
+            if stack:
+                parent, position = stack[-1]
+                sublists = lists[parent][2]
+                if sublists[position] is None:
+                    sublists[position] = len(lists)
+                    lists.append(([], [], []))
+                current = sublists[position]
+            else:
+                current = 0
+
+            uppers, entries, sublists = lists[current]
+            uppers.append(atomic.upper)
+            entries.append((atomic, owner))
+            sublists.append(None)
+            stack.append((current, len(entries) - 1))
+
+        self._lists = lists
+        self._size = size
+
+    def _search(self, lower, upper, accept, result):
+        """
+        Add to result the owners of the atomic intervals whose bounds span a value
+        between lower and upper (both included), and that are accepted by given predicate.
+        """
+        op = get_operator()
+        exact = isinstance(op, ClassicOperator)
+
+        pending = [0]
+        while pending:
+            uppers, entries, sublists = self._lists[pending.pop()]
+
+            # First entry that does not end before lower. Entries before it, and the
+            # ones they contain, end before lower.
+            start = bisect_left(uppers, lower)
+            if not exact:
+                while start > 0 and op.cmp(uppers[start - 1], lower) == 0:
+                    start -= 1
+
+            for position in range(start, len(entries)):
+                atomic, owner = entries[position]
+                if atomic.lower > upper and (exact or op.cmp(atomic.lower, upper) > 0):
+                    break
+                if accept(atomic):
+                    result.add(owner)
+                if sublists[position] is not None:
+                    pending.append(sublists[position])
+
+    def containing(self, value):
+        """
+        Return the indexed intervals that contain given value.
+
+        :param value: a value.
+        :return: the sorted list of the positions of the intervals containing value.
+        """
+        result = set()
+        self._search(value, value, lambda atomic: _contains_value(atomic, value), result)
+        return sorted(result)
+
+    def overlapping(self, interval):
+        """
+        Return the indexed intervals that overlap given interval.
+
+        :param interval: an interval.
+        :return: the sorted list of the positions of the intervals overlapping given one.
+        """
+        if not isinstance(interval, Interval):
+            raise TypeError('Parameter must be an Interval instance')
+
+        result = set()
+        for i in interval._intervals:
+            if not _empty(i):
+                self._search(
+                    i.lower, i.upper, lambda atomic: not _before(atomic, i) and not _before(i, atomic), result
+                )
+        return sorted(result)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return 'IntervalIndex(<{} intervals>)'.format(self._size)
@@ -1,22 +1,127 @@
+import threading
+from array import array
+from bisect import bisect_right
 from collections import namedtuple
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
 from .const import Bound, inf
-from .fuzzy_operator import FuzzyOperator, ClassicOperator
+from .fuzzy_operator import FuzzyOperator, ClassicOperator, QuantizedOperator
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    ContextVar = None
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 Atomic = namedtuple('Atomic', ['left', 'lower', 'upper', 'right'])
+_tuple_new = tuple.__new__
+
+_FLOAT_INF = float('inf')
+_INFINITIES = (inf, -inf, _FLOAT_INF, -_FLOAT_INF)
+_INFINITY_BOUNDS = (inf, -inf)
+# Checking the type of a bound first avoids comparing (finite) bounds with P.inf
+_INFINITY_TYPES = frozenset(map(type, _INFINITY_BOUNDS))
+
+# Atomic intervals of empty intervals
+_EMPTY_ATOMICS = (Atomic(Bound.OPEN, inf, -inf, Bound.OPEN),)
+
+
+class _ThreadLocalVar:
+    """
+    Minimal replacement for contextvars.ContextVar (Python < 3.7), whose values are local to threads.
+    """
+
+    def __init__(self, name):
+        self._local = threading.local()
+
+    def get(self, default):
+        return getattr(self._local, 'value', default)
+
+    def set(self, value):
+        token = getattr(self._local, 'value', None)
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        if token is None:
+            del self._local.value
+        else:
+            self._local.value = token
+
+
+# Operator set for the current context (if any), and process-wide default operator
+_operator = (ContextVar or _ThreadLocalVar)('operator')
+_default_operator = ClassicOperator()
 
-op = ClassicOperator()
 
 def set_operator(operator):
-    global op
-    op = operator
+    """
+    Set the default operator used to compare bounds, in all threads and contexts
+    that do not override it (see tolerance).
+
+    :param operator: a ClassicOperator, FuzzyOperator or QuantizedOperator instance.
+    """
+    global _default_operator
+    _default_operator = operator
+
+
+def _tolerance_operator(rel_tol, abs_tol, quantized):
+    if quantized:
+        if rel_tol != 0:
+            raise ValueError('A relative tolerance cannot be quantized.')
+        return QuantizedOperator(abs_tol)
+    return FuzzyOperator(rel_tol, abs_tol)
+
+
+def set_tolerance(rel_tol, abs_tol, *, quantized=False):
+    """
+    Set the default tolerance used to compare bounds, in all threads and contexts
+    that do not override it (see tolerance).
 
-def set_tolerance(rel_tol, abs_tol):
-    global op
-    if not isinstance(op,FuzzyOperator):
-        op = FuzzyOperator()
+    If quantized is set, the bounds of the intervals that are created afterwards are
+    snapped to the closest multiple of abs_tol, and are then compared exactly.
+
+    :param rel_tol: relative tolerance.
+    :param abs_tol: absolute tolerance.
+    :param quantized: snap bounds to a grid of step abs_tol (default is False).
+    """
+    set_operator(_tolerance_operator(rel_tol, abs_tol, quantized))
+
+
+def get_operator():
+    """
+    Return the operator used to compare bounds in the current context.
+
+    :return: a ClassicOperator, FuzzyOperator or QuantizedOperator instance.
+    """
+    return _operator.get(_default_operator)
+
+
+@contextmanager
+def tolerance(rel_tol=0.0, abs_tol=0.0, *, quantized=False):
+    """
+    Context manager to compare bounds with given tolerance.
+
+    The tolerance only applies to the current thread (or asyncio task), until the
+    end of the with block, and takes precedence over the default one.
+    See set_tolerance for quantized tolerances.
+
+    :param rel_tol: relative tolerance.
+    :param abs_tol: absolute tolerance.
+    :param quantized: snap bounds to a grid of step abs_tol (default is False).
+    """
+    token = _operator.set(_tolerance_operator(rel_tol, abs_tol, quantized))
+    try:
+        yield
+    finally:
+        _operator.reset(token)
 
-    op.rel_tol = rel_tol
-    op.abs_tol = abs_tol
 
 def mergeable(a, b):
     """
@@ -26,15 +131,753 @@ def mergeable(a, b):
     :param b: an atomic interval.
     :return: True if mergeable, False otherwise.
     """
-    if op.lt(a.lower, b.lower) or (a.lower is b.lower and a.left is Bound.CLOSED):
+    op = _operator.get(_default_operator)
+    if op.cmp(a.lower, b.lower) < 0 or (a.lower is b.lower and a.left is Bound.CLOSED):
         first, second = a, b
     else:
         first, second = b, a
 
-    if op.eq(first.upper, second.lower):
+    c = op.cmp(first.upper, second.lower)
+    if c == 0:
         return first.right is Bound.CLOSED or second.left is Bound.CLOSED
+    return c > 0
+
+
+def _empty(i):
+    """
+    Test whether given atomic interval is empty.
+
+    :param i: an atomic interval.
+    :return: True if empty, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(i.lower, i.upper)
+    return c > 0 or (c == 0 and (i.left is Bound.OPEN or i.right is Bound.OPEN))
+
+
+def _before(a, b):
+    """
+    Test whether atomic interval a is entirely on the left of atomic interval b
+    (i.e. a < b for the corresponding intervals).
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if a is before b, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(a.upper, b.lower)
+    if a.right is Bound.OPEN:
+        return c <= 0
+    return c < 0 or (c == 0 and b.left is Bound.OPEN)
+
+
+def _ends_before(a, b):
+    """
+    Test whether atomic interval a does not extend to the right of atomic interval b
+    (i.e. a <= b for the corresponding intervals).
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if a ends before b, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(a.upper, b.upper)
+    if a.right is Bound.OPEN:
+        return c <= 0
+    return c < 0 or (c == 0 and b.right is Bound.CLOSED)
+
+
+def _intersection(a, b):
+    """
+    Return the intersection of two atomic intervals.
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: a (possibly empty) atomic interval.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(a.lower, b.lower)
+    if c == 0:
+        lower = a.lower
+        left = a.left if a.left is Bound.OPEN else b.left
+    elif c > 0:
+        lower, left = a.lower, a.left
+    else:
+        lower, left = b.lower, b.left
+
+    c = op.cmp(a.upper, b.upper)
+    if c == 0:
+        upper = a.upper
+        right = a.right if a.right is Bound.OPEN else b.right
+    elif c < 0:
+        upper, right = a.upper, a.right
+    else:
+        upper, right = b.upper, b.right
+
+    return Atomic(left, lower, upper, right)
+
+
+def _includes(a, b):
+    """
+    Test whether atomic interval b is contained in atomic interval a.
+
+    :param a: an atomic interval.
+    :param b: an atomic interval.
+    :return: True if b is contained in a, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(b.lower, a.lower)
+    if c < 0 or (c == 0 and b.left is Bound.CLOSED and a.left is Bound.OPEN):
+        return False
+    c = op.cmp(b.upper, a.upper)
+    return c < 0 or (c == 0 and (b.right is a.right or a.right is Bound.CLOSED))
+
+
+def _merge(a, b):
+    """
+    Merge two lists of atomic intervals sorted by lower bound (closed first).
+
+    :param a: a list of atomic intervals.
+    :param b: a list of atomic intervals.
+    :return: a new list of atomic intervals, sorted by lower bound (closed first).
+    """
+    result = []
+    i, j = 0, 0
+    len_a, len_b = len(a), len(b)
+
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if y.lower < x.lower or (y.lower == x.lower and x.left is Bound.OPEN and y.left is Bound.CLOSED):
+            result.append(y)
+            j = j + 1
+        else:
+            result.append(x)
+            i = i + 1
+
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+def _insert(intervals, atomic):
+    """
+    Insert an atomic interval into a list of disjoint and non-adjacent atomic intervals.
+
+    Only the atomic intervals that are close to the inserted one are normalized, the
+    other ones are copied as is.
+
+    :param intervals: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :param atomic: a non-empty atomic interval.
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    # First atomic interval whose upper bound is not lower than atomic.lower
+    lo, hi = 0, len(intervals)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if intervals[mid].upper < atomic.lower:
+            lo = mid + 1
+        else:
+            hi = mid
+    start = lo
+
+    # First atomic interval whose lower bound is greater than atomic.upper
+    hi = len(intervals)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if atomic.upper < intervals[mid].lower:
+            hi = mid
+        else:
+            lo = mid + 1
+    end = lo
+
+    # Adjacent (or fuzzily overlapping) neighbours have to be merged as well
+    while start > 0 and mergeable(intervals[start - 1], atomic):
+        start = start - 1
+    while end < len(intervals) and mergeable(intervals[end], atomic):
+        end = end + 1
+
+    result = list(intervals[:start])
+    result.extend(_normalize(_merge(intervals[start:end], [atomic])))
+    result.extend(intervals[end:])
+    return result
+
+
+def _difference(a, b):
+    """
+    Compute the difference of two lists of atomic intervals with a single sweep.
+
+    :param a: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :param b: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    result = []
+    j, len_b = 0, len(b)
+
+    for current in a:
+        while current is not None and j < len_b:
+            other = b[j]
+            if _before(other, current):
+                j = j + 1
+            elif _before(current, other):
+                break
+            else:
+                # Keep what is on the left of other
+                remaining = _intersection(current, Atomic(Bound.OPEN, -inf, other.lower, ~other.left))
+                if not _empty(remaining):
+                    result.append(remaining)
+
+                if _ends_before(current, other):
+                    # Nothing remains, but other can still overlap next atomic interval
+                    current = None
+                else:
+                    # Keep what is on the right of other
+                    current = _intersection(current, Atomic(~other.right, other.upper, inf, Bound.OPEN))
+                    j = j + 1
+
+        if current is not None:
+            result.append(current)
+
+    return result
+
+
+def _difference_exact(a, b):
+    """
+    Compute the difference of two lists of atomic intervals with a single sweep,
+    relying on native comparison operators.
+
+    :param a: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :param b: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    result = []
+    j, len_b = 0, len(b)
+
+    for left, lower, upper, right in a:
+        # (left, lower) is the start of what remains of the current atomic interval
+        remains = True
+        while j < len_b:
+            y = b[j]
+
+            # Skip atomic intervals that are entirely on the left of what remains
+            if y.upper < lower or (y.upper == lower and (y.right is Bound.OPEN or left is Bound.OPEN)):
+                j = j + 1
+                continue
+            # Next atomic intervals are entirely on the right of what remains
+            if upper < y.lower or (upper == y.lower and (right is Bound.OPEN or y.left is Bound.OPEN)):
+                break
+
+            # Keep what is on the left of y
+            if lower < y.lower or (lower == y.lower and left is Bound.CLOSED and y.left is Bound.OPEN):
+                result.append(Atomic(left, lower, y.lower, ~y.left))
+
+            if y.upper < upper or (y.upper == upper and right is Bound.CLOSED and y.right is Bound.OPEN):
+                # Keep what is on the right of y
+                left, lower = ~y.right, y.upper
+                j = j + 1
+            else:
+                # Nothing remains, but y can still overlap next atomic interval
+                remains = False
+                break
+
+        if remains:
+            result.append(Atomic(left, lower, upper, right))
+
+    return result
+
+
+def _symmetric_difference(a, b):
+    """
+    Compute the symmetric difference of two lists of atomic intervals with a single sweep.
+
+    :param a: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :param b: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    op = _operator.get(_default_operator)
+    result = []
+    current = None
+
+    # Atomic intervals of a given operand are disjoint, hence an atomic interval can only
+    # overlap the remaining part of an atomic interval of the other operand.
+    for successor in _merge(a, b):
+        if current is None:
+            current = successor
+        elif _before(current, successor):
+            result.append(current)
+            current = successor
+        else:
+            # Keep what is on the left of successor
+            remaining = _intersection(current, Atomic(Bound.OPEN, -inf, successor.lower, ~successor.left))
+            if not _empty(remaining):
+                result.append(remaining)
+
+            # With fuzzy comparisons, successor can also extend to the left of current
+            if op.cmp(current.lower, successor.lower) >= 0:
+                remaining = _intersection(successor, Atomic(Bound.OPEN, -inf, current.lower, ~current.left))
+                if not _empty(remaining):
+                    result.append(remaining)
+
+            # Keep what is on the right of the overlap
+            if _ends_before(current, successor):
+                current = _intersection(successor, Atomic(~current.right, current.upper, inf, Bound.OPEN))
+            else:
+                current = _intersection(current, Atomic(~successor.right, successor.upper, inf, Bound.OPEN))
+
+            if _empty(current):
+                current = None
+
+    if current is not None:
+        result.append(current)
+
+    # Remaining parts can be adjacent
+    return _normalize(result)
+
+
+def _clip(intervals, window):
+    """
+    Restrict a list of atomic intervals to an atomic interval, relying on binary
+    searches to find the affected atomic intervals. Only the first and the last of
+    them are intersected, as the ones in between are contained in the window.
+
+    :param intervals: a list of sorted, disjoint and non-adjacent atomic intervals.
+    :param window: a non-empty atomic interval.
+    :return: a new list of sorted, disjoint and non-adjacent atomic intervals.
+    """
+    # First atomic interval that is not before the window
+    start, high = 0, len(intervals)
+    while start < high:
+        middle = (start + high) // 2
+        if _before(intervals[middle], window):
+            start = middle + 1
+        else:
+            high = middle
+
+    # First atomic interval that is after the window
+    low, end = start, len(intervals)
+    while low < end:
+        middle = (low + end) // 2
+        if _before(window, intervals[middle]):
+            end = middle
+        else:
+            low = middle + 1
+
+    if start == end:
+        return []
+
+    first = _intersection(intervals[start], window)
+    result = [] if _empty(first) else [first]
+    if end - start > 1:
+        result.extend(intervals[start + 1:end - 1])
+        last = _intersection(intervals[end - 1], window)
+        if not _empty(last):
+            result.append(last)
+    return result
+
+
+def _normalize(intervals):
+    """
+    Merge consecutive atomic intervals in a single sweep.
+
+    :param intervals: an iterable of atomic intervals, sorted by lower bound (closed first).
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    op = _operator.get(_default_operator)
+    if isinstance(op, ClassicOperator):
+        return _normalize_exact(intervals)
+
+    result = []
+    intervals = iter(intervals)
+    current = next(intervals, None)
+    if current is None:
+        return result
+
+    for successor in intervals:
+        if mergeable(current, successor):
+            c = op.cmp(current.lower, successor.lower)
+            if c == 0:
+                lower = current.lower
+                left = current.left if current.left is Bound.CLOSED else successor.left
+            elif c < 0:
+                lower, left = current.lower, current.left
+            else:
+                lower, left = successor.lower, successor.left
+
+            c = op.cmp(current.upper, successor.upper)
+            if c == 0:
+                upper = current.upper
+                right = current.right if current.right is Bound.CLOSED else successor.right
+            elif c > 0:
+                upper, right = current.upper, current.right
+            else:
+                upper, right = successor.upper, successor.right
+
+            current = Atomic(left, lower, upper, right)
+        else:
+            result.append(current)
+            current = successor
+
+    result.append(current)
+    return result
+
+
+def _normalize_exact(intervals):
+    """
+    Counterpart of _normalize relying on native comparison operators.
+
+    Atomic intervals are unpacked, so that plain (left, lower, upper, right) tuples
+    are supported as well.
+
+    :param intervals: an iterable of atomic intervals, sorted by lower bound (closed first).
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    result = []
+    intervals = iter(intervals)
+    current = next(intervals, None)
+    if current is None:
+        return result
+
+    left, lower, upper, right = current
+    for s_left, s_lower, s_upper, s_right in intervals:
+        # As intervals are sorted, s_lower is not lower than lower
+        if s_lower < upper or (
+            s_lower == upper and (right is Bound.CLOSED or s_left is Bound.CLOSED)
+        ):
+            if s_upper > upper:
+                upper, right = s_upper, s_right
+            elif s_upper == upper and s_right is Bound.CLOSED:
+                right = Bound.CLOSED
+            if s_lower == lower and s_left is Bound.CLOSED:
+                left = Bound.CLOSED
+        else:
+            result.append(Atomic(left, lower, upper, right))
+            left, lower, upper, right = s_left, s_lower, s_upper, s_right
+
+    result.append(Atomic(left, lower, upper, right))
+    return result
+
+
+def _simplify(atomics, exact=False):
+    """
+    Drop empty atomic intervals and merge adjacent ones in a single pass, for sorted
+    atomic intervals whose bounds can be equal or close for the current operator.
+
+    :param atomics: a list of atomic intervals (or of plain tuples), sorted by lower bound (closed first).
+    :param exact: True if atomic intervals are known to be non-empty and non-adjacent when
+        bounds are compared exactly, in which case they are kept as is under an exact operator.
+    :return: a list of disjoint and non-adjacent atomic intervals.
+    """
+    op = _operator.get(_default_operator)
+    if isinstance(op, ClassicOperator):
+        if exact:
+            return atomics
+        atomics = [
+            a for a in atomics
+            if a[1] < a[2] or (a[1] == a[2] and a[0] is Bound.CLOSED and a[3] is Bound.CLOSED)
+        ]
+    else:
+        atomics = [a for a in map(Atomic._make, atomics) if not _empty(a)]
+    return _normalize(atomics)
+
+
+def _sweep_events(lists):
+    """
+    Return the sorted events of a sweep over the bounds of given lists of atomic intervals.
+
+    Each bound is mapped to a (value, flag) key such that an atomic interval
+    corresponds to the half-open range [start, end) of keys: a closed lower bound
+    and an open upper bound have flag 0, an open lower bound and a closed upper
+    bound have flag 1. Keys are compared exactly, ie. the tolerance of the current
+    operator is not taken into account. See _key_range for the converse.
+
+    :param lists: an iterable of lists of atomic intervals (empty ones are ignored).
+    :return: a sorted list of (value, flag, index, delta) events, where index is the
+        position of the list in lists, and delta is 1 for a lower bound, -1 for an
+        upper bound.
+    """
+    events = []
+    for index, atomics in enumerate(lists):
+        if _empty(atomics[0]):
+            continue
+        for i in atomics:
+            events.append((i.lower, 0 if i.left is Bound.CLOSED else 1, index, 1))
+            events.append((i.upper, 1 if i.right is Bound.CLOSED else 0, index, -1))
+    events.sort()
+    return events
+
+
+def _key_range(start, end):
+    """
+    Return the atomic interval corresponding to the [start, end) range of (value, flag)
+    keys (see _sweep_events).
+    """
+    return Atomic(
+        Bound.CLOSED if start[1] == 0 else Bound.OPEN, start[0],
+        end[0], Bound.CLOSED if end[1] == 1 else Bound.OPEN,
+    )
+
+
+def _intersection_exact(a, b):
+    """
+    Compute the intersection of two lists of atomic intervals with a single sweep,
+    relying on native comparison operators.
+
+    :param a: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :param b: a list of disjoint and non-adjacent atomic intervals, sorted by lower bound.
+    :return: a new list of disjoint and non-adjacent atomic intervals.
+    """
+    result = []
+    i, j = 0, 0
+    len_a, len_b = len(a), len(b)
+
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+
+        # Skip atomic intervals that are entirely on the left of the other one
+        if x.upper < y.lower or (x.upper == y.lower and (x.right is Bound.OPEN or y.left is Bound.OPEN)):
+            i = i + 1
+            continue
+        if y.upper < x.lower or (y.upper == x.lower and (y.right is Bound.OPEN or x.left is Bound.OPEN)):
+            j = j + 1
+            continue
+
+        # x and y overlap, hence their intersection is not empty
+        if x.lower > y.lower:
+            left, lower = x.left, x.lower
+        elif x.lower < y.lower:
+            left, lower = y.left, y.lower
+        else:
+            left, lower = (x.left if x.left is Bound.OPEN else y.left), x.lower
+
+        if x.upper < y.upper:
+            upper, right = x.upper, x.right
+            i = i + 1
+        elif x.upper > y.upper:
+            upper, right = y.upper, y.right
+            j = j + 1
+        else:
+            upper, right = x.upper, (x.right if x.right is Bound.OPEN else y.right)
+            if x.right is Bound.OPEN:
+                i = i + 1
+            else:
+                j = j + 1
+
+        result.append(Atomic(left, lower, upper, right))
+
+    return result
 
-    return op.gt(first.upper, second.lower)
+
+def _contains_value(i, item):
+    """
+    Test whether given value is contained in given atomic interval.
+
+    :param i: an atomic interval.
+    :param item: a value.
+    :return: True if value is contained, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    c = op.cmp(item, i.lower)
+    if c < 0 or (c == 0 and i.left is Bound.OPEN):
+        return False
+    c = op.cmp(item, i.upper)
+    return c < 0 or (c == 0 and i.right is Bound.CLOSED)
+
+
+def _contains_sorted(intervals, last, item):
+    """
+    Test whether given value is contained in one of given sorted atomic intervals.
+
+    Due to fuzzy comparisons, the value can belong to the atomic intervals before the
+    last one whose lower bound is lower than or equal to it, as long as it is close to
+    their upper bound, or to the next ones, as long as it is close to their lower bound.
+
+    :param intervals: a list of atomic intervals.
+    :param last: the number of atomic intervals whose lower bound is lower than or equal to item.
+    :param item: a value.
+    :return: True if value is contained, False otherwise.
+    """
+    op = _operator.get(_default_operator)
+    if last > 0 and _contains_value(intervals[last - 1], item):
+        return True
+    for k in range(last - 2, -1, -1):
+        if op.cmp(item, intervals[k].upper) != 0:
+            break
+        if _contains_value(intervals[k], item):
+            return True
+    for k in range(last, len(intervals)):
+        if op.cmp(item, intervals[k].lower) != 0:
+            break
+        if _contains_value(intervals[k], item):
+            return True
+    return False
+
+
+def _contains_many(intervals, values):
+    """
+    Vectorized counterpart of _contains_value for a list of atomic intervals.
+
+    :param intervals: a list of atomic intervals.
+    :param values: a numpy array of floats.
+    :return: a numpy array of booleans.
+    """
+    op = _operator.get(_default_operator)
+    lowers = numpy.array([float(i.lower) for i in intervals])
+    uppers = numpy.array([float(i.upper) for i in intervals])
+    lefts = numpy.array([i.left is Bound.CLOSED for i in intervals])
+    rights = numpy.array([i.right is Bound.CLOSED for i in intervals])
+
+    if isinstance(op, FuzzyOperator):
+        def isclose(a, b):
+            # Same semantics as math.isclose, including for infinities
+            with numpy.errstate(invalid='ignore'):
+                diff = numpy.abs(a - b)
+                tolerance = numpy.maximum(op.rel_tol * numpy.maximum(numpy.abs(a), numpy.abs(b)), op.abs_tol)
+                return (a == b) | (numpy.isfinite(diff) & (diff <= tolerance))
+    else:
+        isclose = numpy.equal
+
+    def contained(candidates):
+        # Containment in, and closeness to the bounds of given atomic interval for each value
+        valid = (candidates >= 0) & (candidates < len(intervals))
+        candidates = numpy.clip(candidates, 0, len(intervals) - 1)
+        lower, upper = lowers[candidates], uppers[candidates]
+        close_lower, close_upper = valid & isclose(values, lower), valid & isclose(values, upper)
+
+        left = numpy.where(lefts[candidates], (values > lower) | close_lower, (values > lower) & ~close_lower)
+        right = numpy.where(rights[candidates], (values < upper) | close_upper, (values < upper) & ~close_upper)
+        return valid & left & right, close_lower, close_upper
+
+    # Last atomic interval whose lower bound is lower than or equal to each value.
+    # Due to fuzzy comparisons, values can also belong to the previous ones as long as they
+    # are close to their upper bound, and to the next ones as long as they are close to
+    # their lower bound (see _contains_sorted).
+    last = numpy.searchsorted(lowers, values, side='right') - 1
+    result = contained(last)[0]
+    for step in (-1, 1):
+        candidates, pending = last + step, numpy.ones(values.shape, dtype=bool)
+        while pending.any():
+            within, close_lower, close_upper = contained(candidates)
+            result |= pending & within
+            pending &= close_upper if step < 0 else close_lower
+            candidates = candidates + step
+
+    return result
+
+
+def _as_list(values):
+    """
+    Convert a sequence or a numpy array of values to a list of (native) values.
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.ravel().tolist()
+    return list(values)
+
+
+_BOUNDARIES = {Bound.CLOSED: Bound.CLOSED, Bound.OPEN: Bound.OPEN, True: Bound.CLOSED, False: Bound.OPEN}
+_CLOSED = {Bound.CLOSED: True, Bound.OPEN: False, True: True, False: False}
+
+
+def _boundaries(boundaries, length, closed=False):
+    """
+    Convert a single boundary or a sequence (or a numpy array) of boundaries, either Bound
+    values or Booleans, to a sequence of Bound values of given length, or of Booleans (True
+    standing for CLOSED) if closed is set.
+    """
+    mapping = _CLOSED if closed else _BOUNDARIES
+    if not isinstance(boundaries, Iterable):
+        return [mapping[boundaries]] * length
+
+    if closed and numpy is not None and isinstance(boundaries, numpy.ndarray) and boundaries.dtype == bool:
+        boundaries = boundaries.ravel()
+    else:
+        boundaries = [mapping[b] for b in _as_list(boundaries)]
+    if len(boundaries) != length:
+        raise ValueError('Boundaries and bounds must have the same length.')
+    return boundaries
+
+
+# Packed boundaries: bit 0 for a closed left boundary, bit 1 for a closed right boundary,
+# bit 2 for an infinite lower bound, and bit 3 for an infinite upper bound.
+_PACKED_BOUNDARIES = [
+    (left, right) for _ in range(4) for right in (Bound.OPEN, Bound.CLOSED) for left in (Bound.OPEN, Bound.CLOSED)
+]
+
+
+def _pack(intervals):
+    """
+    Pack the atomic intervals of given non-empty intervals in a flat array of bounds
+    (lower and upper bounds, alternatively) and in one byte per atomic interval for
+    its boundaries and infinities.
+
+    Bounds are packed only if they are all floats (in an array of doubles) or all
+    integers (in an array of signed 64-bit integers). Otherwise, None is returned.
+
+    :param intervals: an iterable of non-empty intervals.
+    :return: a pair (array of bounds, bytes), or None.
+    """
+    bounds, flags = [], bytearray()
+    for interval in intervals:
+        atomics = interval._intervals
+        start = len(bounds)
+        bounds.extend(chain.from_iterable(map(itemgetter(1, 2), atomics)))
+        flags.extend([(atomic[0] is Bound.CLOSED) + 2 * (atomic[3] is Bound.CLOSED) for atomic in atomics])
+
+        # Only the first and last atomic intervals can have infinite bounds
+        if atomics[0].lower == -inf:
+            bounds[start] = None
+            flags[start // 2] |= 4
+        if atomics[-1].upper == inf:
+            bounds[-1] = None
+            flags[-1] |= 8
+
+    types = set(map(type, bounds))
+    if type(None) in types:
+        types.discard(type(None))
+        default = 0.0 if types <= {float} else 0
+        bounds = [default if value is None else value for value in bounds]
+
+    try:
+        if types <= {float}:
+            return array('d', bounds), bytes(flags)
+        if types == {int}:
+            return array('q', bounds), bytes(flags)
+    except OverflowError:
+        pass
+    return None
+
+
+def _unpack(bounds, flags):
+    """
+    Unpack the atomic intervals that were packed by _pack.
+
+    :param bounds: an array of bounds.
+    :param flags: the packed boundaries and infinities.
+    :return: a list of atomic intervals.
+    """
+    values = iter(bounds)
+    atomics = list(map(Atomic._make, (
+        (left, lower, upper, right)
+        for (left, right), lower, upper in zip(map(_PACKED_BOUNDARIES.__getitem__, flags), values, values)
+    )))
+
+    for position in [position for position, flag in enumerate(flags) if flag > 3]:
+        left, lower, upper, right = atomics[position]
+        if flags[position] & 4:
+            lower = -inf
+        if flags[position] & 8:
+            upper = inf
+        atomics[position] = Atomic(left, lower, upper, right)
+    return atomics
+
+
+def _unpickle(cls, bounds, flags, compact=False):
+    """
+    Create an instance of given Interval class from its packed atomic intervals.
+    Used by Interval.__reduce__.
+    """
+    instance = cls.__new__(cls)
+    instance._intervals = _PackedAtomics(bounds, flags) if compact else tuple(_unpack(bounds, flags))
+    instance._is_empty = False
+    return instance
 
 
 def open(lower, upper):
@@ -93,11 +936,111 @@ def singleton(value):
 
 def empty():
     """
-    Create an empty interval.
+    Create an empty interval. As intervals are immutable, a single
+    empty interval is shared.
 
     :return: an interval.
     """
-    return Interval.from_atomic(Bound.OPEN, inf, -inf, Bound.OPEN)
+    return _EMPTY
+
+
+class _PackedAtomics(Sequence):
+    """
+    An immutable sequence of atomic intervals, stored in a flat array of bounds and in
+    one byte per atomic interval for its boundaries and infinities (see _pack).
+
+    It is used in place of a tuple by compact intervals. Atomic intervals are created
+    on the fly when they are accessed.
+    """
+
+    __slots__ = ('_bounds', '_flags')
+
+    def __init__(self, bounds, flags):
+        self._bounds = bounds
+        self._flags = flags
+
+    def _atomic(self, index, lower, upper):
+        flag = self._flags[index]
+        left, right = _PACKED_BOUNDARIES[flag]
+        if flag & 4:
+            lower = -inf
+        if flag & 8:
+            upper = inf
+        return Atomic(left, lower, upper, right)
+
+    def __len__(self):
+        return len(self._flags)
+
+    def __iter__(self):
+        values = iter(self._bounds)
+        for flag, lower, upper in zip(self._flags, values, values):
+            left, right = _PACKED_BOUNDARIES[flag]
+            if flag > 3:
+                lower = -inf if flag & 4 else lower
+                upper = inf if flag & 8 else upper
+            yield Atomic(left, lower, upper, right)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self._flags))
+            if step != 1:
+                return tuple(self[index] for index in range(start, stop, step))
+            stop = max(start, stop)
+            return tuple(_unpack(self._bounds[2 * start:2 * stop], self._flags[start:stop]))
+
+        if item < 0:
+            item += len(self._flags)
+        if not 0 <= item < len(self._flags):
+            raise IndexError('index out of range')
+        return self._atomic(item, self._bounds[2 * item], self._bounds[2 * item + 1])
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        # Same hash than the tuple of the same atomic intervals
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return _PackedAtomics, (self._bounds, self._flags)
+
+
+class AtomicView(Sequence):
+    """
+    A lazy and read-only view on the atomic intervals of an Interval.
+
+    Items are (left, lower, upper, right) named tuples. Slicing a view returns
+    another view on the same atomic intervals, without copying them.
+    """
+
+    __slots__ = ('_intervals', '_range')
+
+    def __init__(self, intervals, indices=None):
+        """
+        Create a view on given atomic intervals.
+
+        :param intervals: a sequence of atomic intervals.
+        :param indices: an optional range of indices to consider.
+        """
+        self._intervals = intervals
+        self._range = range(len(intervals)) if indices is None else indices
+
+    def __len__(self):
+        return len(self._range)
+
+    def __iter__(self):
+        return map(self._intervals.__getitem__, self._range)
+
+    def __reversed__(self):
+        return map(self._intervals.__getitem__, reversed(self._range))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return AtomicView(self._intervals, self._range[item])
+        return self._intervals[self._range[item]]
+
+    def __repr__(self):
+        return 'AtomicView({!r})'.format(list(self))
 
 
 class Interval:
@@ -107,9 +1050,12 @@ class Interval:
     An interval is an (automatically simplified) union of atomic intervals.
     It can be created with Interval.from_atomic(), by passing intervals to __init__, or by using
     one of the helpers provided in this module (open, closed, openclosed, etc.)
+
+    Intervals are immutable: their atomic intervals are stored in a tuple, emptiness is
+    determined on creation, and the enclosure and the hash are computed once, on first access.
     """
 
-    __slots__ = ('_intervals',)
+    __slots__ = ('_intervals', '_is_empty', '_enclosure', '_hash')
 
     def __init__(self, *intervals):
         """
@@ -117,49 +1063,29 @@ class Interval:
 
         :param intervals: zero, one or more intervals.
         """
-        self._intervals = list()
+        if len(intervals) == 0:
+            self._intervals = _EMPTY_ATOMICS
+            self._is_empty = True
+            return
+
+        atomics = []
 
         for interval in intervals:
             if isinstance(interval, Interval):
                 if not interval.empty:
-                    self._intervals.extend(interval._intervals)
+                    atomics.extend(interval._intervals)
             else:
                 raise TypeError('Parameters must be Interval instances')
 
-        if len(self._intervals) == 0:
+        if len(atomics) == 0:
             # So we have at least one (empty) interval
-            self._intervals.append(Atomic(Bound.OPEN, inf, -inf, Bound.OPEN))
+            self._intervals = _EMPTY_ATOMICS
+            self._is_empty = True
         else:
-            # Sort intervals by lower bound
-            self._intervals.sort(key=lambda i: i.lower)
-
-            i = 0
-            # Try to merge consecutive intervals
-            while i < len(self._intervals) - 1:
-                current = self._intervals[i]
-                successor = self._intervals[i + 1]
-
-                if mergeable(current, successor):
-                    if op.eq(current.lower, successor.lower):
-                        lower = current.lower
-                        left = current.left if current.left is Bound.CLOSED else successor.left
-                    else:
-                        lower = min(current.lower, successor.lower)
-                        left = current.left if op.eq(lower, current.lower) else successor.left
-
-                    if op.eq(current.upper, successor.upper):
-                        upper = current.upper
-                        right = current.right if current.right is Bound.CLOSED else successor.right
-                    else:
-                        upper = max(current.upper, successor.upper)
-                        right = current.right if op.eq(upper, current.upper) else successor.right
-
-                    union = Atomic(left, lower, upper, right)
-                    self._intervals.pop(i)  # pop current
-                    self._intervals.pop(i)  # pop successor
-                    self._intervals.insert(i, union)
-                else:
-                    i = i + 1
+            # Sort intervals by lower bound, closed ones first
+            atomics.sort(key=lambda i: (i.lower, i.left is Bound.OPEN))
+            self._intervals = tuple(_normalize(atomics))
+            self._is_empty = False
 
     @property
     def left(self):
@@ -194,10 +1120,7 @@ class Interval:
         """
         True if interval is empty, False otherwise.
         """
-        return (
-            op.gt(self.lower, self.upper) or
-            (op.eq(self.lower, self.upper) and (self.left is Bound.OPEN or self.right is Bound.OPEN))
-        )
+        return self._is_empty
 
     @property
     def atomic(self):
@@ -217,16 +1140,168 @@ class Interval:
         :param upper: value of the upper bound.
         :param right: either CLOSED or OPEN.
         """
-        left = left if lower not in [inf, -inf] else Bound.OPEN
-        right = right if upper not in [inf, -inf] else Bound.OPEN
+        op = _operator.get(_default_operator)
+        if isinstance(op, QuantizedOperator):
+            lower, upper = op.snap(lower), op.snap(upper)
+        return Interval._from_bounds(left, lower, upper, right, op)
 
-        instance = Interval()
-        instance._intervals = [Atomic(left, lower, upper, right)]
-        if instance.empty:
-            return Interval()
+    @staticmethod
+    def _from_bounds(left, lower, upper, right, op):
+        """
+        Counterpart of from_atomic whose bounds are not snapped, for bounds that are
+        read from existing intervals.
+
+        :param op: the current operator.
+        """
+        # Infinities can only be excluded, so there is no need to check open boundaries
+        if left is Bound.CLOSED and type(lower) in _INFINITY_TYPES and lower in _INFINITY_BOUNDS:
+            left = Bound.OPEN
+        if right is Bound.CLOSED and type(upper) in _INFINITY_TYPES and upper in _INFINITY_BOUNDS:
+            right = Bound.OPEN
+
+        # Bypass the (pure Python) constructor of the named tuple
+        if isinstance(op, ClassicOperator):
+            if not (lower < upper or (lower == upper and left is Bound.CLOSED and right is Bound.CLOSED)):
+                return _EMPTY
+            atomic = _tuple_new(Atomic, (left, lower, upper, right))
+        else:
+            atomic = _tuple_new(Atomic, (left, lower, upper, right))
+            if _empty(atomic):
+                return _EMPTY
 
+        instance = Interval.__new__(Interval)
+        instance._intervals = (atomic,)
+        instance._is_empty = False
         return instance
 
+    @staticmethod
+    def from_arrays(lowers, uppers, lefts=Bound.CLOSED, rights=Bound.CLOSED, *, presorted=False):
+        """
+        Create an Interval instance from many atomic intervals at once.
+
+        Bounds are provided as parallel sequences (or numpy arrays). Boundaries can be provided
+        either as sequences or as single values, in which case they apply to all atomic
+        intervals. They are either CLOSED and OPEN, or Booleans (True standing for CLOSED).
+        Empty atomic intervals are ignored, and float infinities are converted to P.inf.
+
+        :param lowers: values of the lower bounds.
+        :param uppers: values of the upper bounds.
+        :param lefts: left boundaries (default is CLOSED).
+        :param rights: right boundaries (default is CLOSED).
+        :param presorted: set to True if atomic intervals are already sorted by lower bound
+            (closed ones first), to skip sorting them. The result is undefined otherwise.
+        :return: an Interval instance.
+        """
+        op = _operator.get(_default_operator)
+        lowers, uppers = _as_list(lowers), _as_list(uppers)
+        if len(lowers) != len(uppers):
+            raise ValueError('Lower and upper bounds must have the same length.')
+        # Atomic intervals sharing their lower bound need to be sorted by left boundary
+        key = itemgetter(1) if not isinstance(lefts, Iterable) else lambda r: (r[1], r[0] is Bound.OPEN)
+        lefts, rights = _boundaries(lefts, len(lowers)), _boundaries(rights, len(uppers))
+
+        if isinstance(op, QuantizedOperator):
+            lowers, uppers = [op.snap(v) for v in lowers], [op.snap(v) for v in uppers]
+
+        # Rows are kept as plain tuples, as creating named tuples is comparatively slow
+        rows = zip(lefts, lowers, uppers, rights)
+        if isinstance(op, ClassicOperator):
+            rows = [
+                (left, lower, upper, right) for left, lower, upper, right in rows
+                if lower < upper or (
+                    lower == upper and left is Bound.CLOSED and right is Bound.CLOSED
+                    and lower not in _INFINITIES
+                )
+            ]
+        else:
+            rows = [
+                (left, lower, upper, right) for left, lower, upper, right in rows
+                if op.cmp(lower, upper) < 0 or (
+                    op.cmp(lower, upper) == 0 and left is Bound.CLOSED and right is Bound.CLOSED
+                    and lower not in _INFINITIES
+                )
+            ]
+
+        if len(rows) == 0:
+            return _EMPTY
+
+        if not presorted:
+            rows.sort(key=key)
+        atomics = _normalize(rows if isinstance(op, ClassicOperator) else map(Atomic._make, rows))
+
+        # Once normalized, infinities can only be found at both ends
+        if atomics[0].lower in (-inf, -_FLOAT_INF):
+            atomics[0] = Atomic(Bound.OPEN, -inf, atomics[0].upper, atomics[0].right)
+        if atomics[-1].upper in (inf, _FLOAT_INF):
+            atomics[-1] = Atomic(atomics[-1].left, atomics[-1].lower, inf, Bound.OPEN)
+
+        return Interval._from_atomics(atomics)
+
+    @staticmethod
+    def _from_atomics(intervals):
+        """
+        Create an Interval instance from a list of atomic intervals that are
+        sorted, disjoint, non-adjacent and non-empty. No check is performed.
+
+        :param intervals: a (possibly empty) sequence of atomic intervals.
+        """
+        if len(intervals) == 0:
+            return _EMPTY
+
+        instance = Interval.__new__(Interval)
+        instance._intervals = tuple(intervals)
+        instance._is_empty = False
+        return instance
+
+    def compact(self):
+        """
+        Return an equivalent interval whose atomic intervals are stored compactly.
+
+        Bounds are stored in a flat array of doubles (or of 64-bit integers), and the
+        boundaries of each atomic interval in a single byte, which takes about 17 bytes
+        per atomic interval instead of more than 100 bytes. Atomic intervals are created
+        on the fly when they are accessed, so that operations are slower on compact
+        intervals. Their results are not compact.
+
+        If bounds are neither all floats nor all integers (or if the interval is empty),
+        the interval is returned as is.
+
+        :return: an Interval instance.
+        """
+        if self._is_empty or isinstance(self._intervals, _PackedAtomics):
+            return self
+
+        packed = _pack([self])
+        if packed is None:
+            return self
+        return Interval._from_packed(*packed)
+
+    @staticmethod
+    def _from_packed(bounds, flags):
+        """
+        Create a compact interval from non-empty packed atomic intervals (see _pack).
+        No check is performed.
+
+        :param bounds: an array of bounds.
+        :param flags: the packed boundaries and infinities.
+        :return: an Interval instance.
+        """
+        instance = Interval.__new__(Interval)
+        instance._intervals = _PackedAtomics(bounds, flags)
+        instance._is_empty = False
+        return instance
+
+    def atomics(self):
+        """
+        Return a lazy and read-only view on the underlying atomic intervals.
+
+        Contrary to iterating or indexing this interval, no Interval instance
+        is created: the view provides (left, lower, upper, right) named tuples.
+
+        :return: a view object.
+        """
+        return AtomicView(self._intervals)
+
     @property
     def enclosure(self):
         """
@@ -235,7 +1310,15 @@ class Interval:
 
         :return: an Interval instance.
         """
-        return Interval.from_atomic(self.left, self.lower, self.upper, self.right)
+        try:
+            return self._enclosure
+        except AttributeError:
+            if self.atomic:
+                self._enclosure = self
+            else:
+                # Bounds are already snapped, if needed
+                self._enclosure = Interval._from_atomics([Atomic(self.left, self.lower, self.upper, self.right)])
+            return self._enclosure
 
     def replace(self, left=None, lower=None, upper=None, right=None, *, ignore_inf=True):
         """
@@ -256,6 +1339,9 @@ class Interval:
         :param ignore_inf: ignore infinities if functions are provided (default is True).
         :return: an Interval instance
         """
+        op = _operator.get(_default_operator)
+        # Only provided bounds are snapped, as current ones already are (if needed)
+        snap = op.snap if isinstance(op, QuantizedOperator) else (lambda value: value)
         enclosure = self.enclosure
 
         if callable(left):
@@ -267,17 +1353,17 @@ class Interval:
             if ignore_inf and enclosure.lower in [-inf, inf]:
                 lower = enclosure.lower
             else:
-                lower = lower(enclosure.lower)
+                lower = snap(lower(enclosure.lower))
         else:
-            lower = enclosure.lower if lower is None else lower
+            lower = enclosure.lower if lower is None else snap(lower)
 
         if callable(upper):
             if ignore_inf and enclosure.upper in [-inf, inf]:
                 upper = enclosure.upper
             else:
-                upper = upper(enclosure.upper)
+                upper = snap(upper(enclosure.upper))
         else:
-            upper = enclosure.upper if upper is None else upper
+            upper = enclosure.upper if upper is None else snap(upper)
 
         if callable(right):
             right = right(enclosure.right)
@@ -285,16 +1371,42 @@ class Interval:
             right = enclosure.right if right is None else right
 
         if self.atomic:
-            return Interval.from_atomic(left, lower, upper, right)
+            return Interval._from_bounds(left, lower, upper, right, op)
 
-        n_interval = self & Interval.from_atomic(left, lower, upper, right)
+        n_interval = self.clip(Interval._from_bounds(left, lower, upper, right, op))
 
         if n_interval.atomic:
             return n_interval.replace(left, lower, upper, right)
 
-        lowest = n_interval[0].replace(left=left, lower=lower)
-        highest = n_interval[-1].replace(upper=upper, right=right)
-        return Interval(lowest, *n_interval[1:-1], highest)
+        # Only the first and the last atomic intervals are extended
+        first, last = n_interval._intervals[0], n_interval._intervals[-1]
+        lowest = Interval._from_bounds(left, lower, first.upper, first.right, op)
+        highest = Interval._from_bounds(last.left, last.lower, upper, right, op)
+        return Interval._from_atomics(
+            lowest._intervals + n_interval._intervals[1:-1] + highest._intervals
+        )
+
+    def clip(self, window):
+        """
+        Restrict this interval to given window.
+
+        This is equivalent to self & window, but the atomic intervals that are
+        affected by each atomic interval of the window are found by binary search.
+        Clipping to an atomic window therefore takes O(log n + k) time, where k is
+        the number of atomic intervals in the window.
+
+        :param window: an interval.
+        :return: an Interval instance.
+        """
+        if not isinstance(window, Interval):
+            raise TypeError('Parameter must be an Interval instance')
+        if self.empty or window.empty:
+            return _EMPTY
+
+        result = []
+        for atomic in window._intervals:
+            result.extend(_clip(self._intervals, atomic))
+        return Interval._from_atomics(result)
 
     def apply(self, func):
         """
@@ -324,6 +1436,70 @@ class Interval:
 
         return Interval(*intervals)
 
+    def apply_monotone(self, func, *, decreasing=False):
+        """
+        Apply a strictly monotonic function on the bounds of this interval.
+
+        As such a function preserves (or reverses) the order of the bounds, the atomic
+        intervals do not need to be sorted again. If the function is decreasing, the
+        order of the atomic intervals is reversed, and their boundaries are swapped.
+        Infinities are not passed to the function: they are kept as is, or negated if
+        the function is decreasing. The result is undefined if the function is not
+        strictly monotonic.
+
+        :param func: function to apply on each finite bound.
+        :param decreasing: set to True if given function is decreasing (default is False).
+        :return: an Interval instance.
+        """
+        if self.empty:
+            return self
+
+        op = _operator.get(_default_operator)
+        if isinstance(op, QuantizedOperator):
+            func = (lambda f: lambda value: op.snap(f(value)))(func)
+
+        def map_atomic(atomic):
+            # Only the first and last atomic intervals can have infinite bounds
+            left, lower, upper, right = atomic
+            lower = func(lower) if lower != -inf else (inf if decreasing else -inf)
+            upper = func(upper) if upper != inf else (-inf if decreasing else inf)
+            return left, lower, upper, right
+
+        intervals = self._intervals
+        atomics = [map_atomic(intervals[0])]
+        atomics.extend((left, func(lower), func(upper), right) for left, lower, upper, right in intervals[1:-1])
+        if len(intervals) > 1:
+            atomics.append(map_atomic(intervals[-1]))
+
+        if decreasing:
+            atomics = [(right, upper, lower, left) for left, lower, upper, right in reversed(atomics)]
+
+        # Bounds can become equal due to rounding errors or to the tolerance
+        return Interval._from_atomics(_simplify(atomics))
+
+    def shift(self, delta):
+        """
+        Shift the bounds of this interval by given value.
+
+        :param delta: value to add to the bounds.
+        :return: an Interval instance.
+        """
+        return self.apply_monotone(lambda value: value + delta)
+
+    def scale(self, factor):
+        """
+        Multiply the bounds of this interval by given (non-zero) factor.
+
+        If the factor is negative, the interval is mirrored, ie. [1,2) | (3,4]
+        scaled by -1 is [-4,-3) | (-2,-1].
+
+        :param factor: non-zero value by which bounds are multiplied.
+        :return: an Interval instance.
+        """
+        if factor == 0:
+            raise ValueError('Scaling factor cannot be zero.')
+        return self.apply_monotone(lambda value: value * factor, decreasing=factor < 0)
+
     def adjacent(self, other):
         """
         Test if given interval is adjacent.
@@ -343,15 +1519,15 @@ class Interval:
         :return: True if intervals overlap, False otherwise.
         """
         if isinstance(other, Interval):
-            i_iter = iter(self)
-            o_iter = iter(other)
+            i_iter = iter(self._intervals)
+            o_iter = iter(other._intervals)
             i_current = next(i_iter)
             o_current = next(o_iter)
 
             while i_current is not None and o_current is not None:
-                if i_current < o_current:
+                if _before(i_current, o_current):
                     i_current = next(i_iter, None)
-                elif o_current < i_current:
+                elif _before(o_current, i_current):
                     o_current = next(o_iter, None)
                 else:
                     return True
@@ -387,6 +1563,32 @@ class Interval:
         """
         return item in self
 
+    def contains_many(self, values):
+        """
+        Test which of given values are contained in this interval.
+
+        If numpy is available, values are converted to an array of floats and
+        a numpy array of booleans (with the same shape) is returned. Otherwise,
+        a list of booleans is returned. In both cases, infinities are never
+        contained, and the current tolerance (if any) is taken into account.
+
+        :param values: a sequence or a numpy array of values.
+        :return: an array (or a list) of booleans.
+        """
+        op = _operator.get(_default_operator)
+        if numpy is not None and isinstance(op, (ClassicOperator, FuzzyOperator)):
+            return _contains_many(self._intervals, numpy.asarray(values, dtype=float))
+
+        intervals = [
+            Atomic(i.left, float(i.lower), float(i.upper), i.right) for i in self._intervals
+        ]
+        lowers = [i.lower for i in intervals]
+
+        result = []
+        for value in values:
+            result.append(_contains_sorted(intervals, bisect_right(lowers, value), value))
+        return result
+
     def complement(self):
         """
         Return the complement of this interval.
@@ -404,119 +1606,192 @@ class Interval:
         """
         return self - other
 
+    def symmetric_difference(self, other):
+        """
+        Return the symmetric difference of two intervals, i.e. the values that
+        belong to exactly one of them.
+
+        :param other: an interval.
+        :return: the symmetric difference of the intervals.
+        """
+        return self ^ other
+
+    def __reduce__(self):
+        # Bounds are pickled in a flat array if they are all floats or all integers,
+        # and boundaries in one byte per atomic interval.
+        cls = type(self)
+        if self._is_empty:
+            return cls, ()
+        if isinstance(self._intervals, _PackedAtomics):
+            return _unpickle, (cls, self._intervals._bounds, self._intervals._flags, True)
+        packed = _pack([self])
+        if packed is not None:
+            return _unpickle, (cls, ) + packed
+        return cls, (), self.__getstate__()
+
+    def __getstate__(self):
+        # Cached attributes are not pickled, as hashes of strings vary between processes
+        return self._intervals
+
+    def __setstate__(self, state):
+        # Previous releases pickled slots, as (None, {'_intervals': list of atomic intervals})
+        if len(state) == 2 and state[0] is None and isinstance(state[1], dict):
+            state = tuple(state[1]['_intervals'])
+        self._intervals = state
+        self._is_empty = _empty(state[0])
+
     def __len__(self):
         return len(self._intervals)
 
+    def _atomic_interval(self, atomic):
+        # Atomic intervals are already snapped, if needed
+        return _EMPTY if self._is_empty else Interval._from_atomics([atomic])
+
     def __iter__(self):
-        return iter([Interval.from_atomic(*i) for i in self._intervals])
+        return iter([self._atomic_interval(i) for i in self._intervals])
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            return [Interval.from_atomic(*i) for i in self._intervals[item]]
-        return Interval.from_atomic(*self._intervals[item])
+            return [self._atomic_interval(i) for i in self._intervals[item]]
+        return self._atomic_interval(self._intervals[item])
 
     def __and__(self, other):
+        op = _operator.get(_default_operator)
         if not isinstance(other, Interval):
             return NotImplemented
 
-        if self.atomic and other.atomic:
-            if op.eq(self.lower, other.lower):
-                lower = self.lower
-                left = self.left if self.left is Bound.OPEN else other.left
-            else:
-                lower = max(self.lower, other.lower)
-                left = self.left if op.eq(lower, self.lower) else other.left
+        if isinstance(op, ClassicOperator):
+            return Interval._from_atomics(_intersection_exact(self._intervals, other._intervals))
 
-            if op.eq(self.upper, other.upper):
-                upper = self.upper
-                right = self.right if self.right is Bound.OPEN else other.right
-            else:
-                upper = min(self.upper, other.upper)
-                right = self.right if op.eq(upper, self.upper) else other.right
-
-            return Interval.from_atomic(left, lower, upper, right)
+        if self.atomic and other.atomic:
+            intersection = _intersection(self._intervals[0], other._intervals[0])
+            return _EMPTY if _empty(intersection) else Interval._from_atomics([intersection])
 
         intersections = []
 
-        i_iter = iter(self)
-        o_iter = iter(other)
+        i_iter = iter(self._intervals)
+        o_iter = iter(other._intervals)
         i_current = next(i_iter)
         o_current = next(o_iter)
 
         while i_current is not None and o_current is not None:
-            if i_current < o_current:
+            if _before(i_current, o_current):
                 i_current = next(i_iter, None)
-            elif o_current < i_current:
+            elif _before(o_current, i_current):
                 o_current = next(o_iter, None)
             else:
                 # i_current and o_current have an overlap
-                intersections.append(i_current & o_current)
+                intersection = _intersection(i_current, o_current)
+                if not _empty(intersection):
+                    intersections.append(intersection)
 
-                if i_current <= o_current:
+                if _ends_before(i_current, o_current):
                     # o_current can still intersect next i
                     i_current = next(i_iter, None)
-                elif o_current <= i_current:
+                else:
                     # i_current can still intersect next o
                     o_current = next(o_iter, None)
-                else:
-                    assert False
 
-        return Interval(*intersections)
+        return Interval._from_atomics(_normalize(intersections))
 
     def __or__(self, other):
         if isinstance(other, Interval):
-            return Interval(self, other)
+            if other.empty:
+                return self
+            if self.empty:
+                return other
+            if other.atomic:
+                return Interval._from_atomics(_insert(self._intervals, other._intervals[0]))
+            if self.atomic:
+                return Interval._from_atomics(_insert(other._intervals, self._intervals[0]))
+            return Interval._from_atomics(_normalize(_merge(self._intervals, other._intervals)))
         return NotImplemented
 
     def __contains__(self, item):
+        op = _operator.get(_default_operator)
         if isinstance(item, Interval):
             if self.atomic:
-                left = op.gt(item.lower, self.lower) or (op.eq(item.lower, self.lower) and (item.left is self.left or self.left is Bound.CLOSED))
-                right = op.lt(item.upper, self.upper) or (op.eq(item.upper, self.upper) and (item.right is self.right or self.right is Bound.CLOSED))
-                return left and right
+                return _includes(self._intervals[0], Atomic(item.left, item.lower, item.upper, item.right))
 
-            selfiter = iter(self)
+            selfiter = iter(self._intervals)
             current = next(selfiter)
 
-            for other in item:
-                while current < other:
+            for other in item._intervals:
+                while _before(current, other):
                     try:
                         current = next(selfiter)
                     except StopIteration:
                         return False
 
                 # here current and other could have an overlap
-                if other not in current:
+                if not _includes(current, other):
                     return False
             return True
 
-        # Item is a value
-        for i in self._intervals:
-            left = op.ge(item, i.lower) if i.left is Bound.CLOSED else op.gt(item, i.lower)
-            right = op.le(item, i.upper) if i.right is Bound.CLOSED else op.lt(item, i.upper)
-            if left and right:
-                return True
-        return False
+        # Item is a value. Look for the last atomic interval whose lower bound is lower than or
+        # equal to item. Due to fuzzy comparisons, item can also belong to its neighbours.
+        intervals = self._intervals
+        lo, hi = 0, len(intervals)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if item < intervals[mid].lower:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        if isinstance(op, ClassicOperator):
+            if lo == 0:
+                return False
+            i = intervals[lo - 1]
+            return (
+                (item > i.lower or (item == i.lower and i.left is Bound.CLOSED)) and
+                (item < i.upper or (item == i.upper and i.right is Bound.CLOSED))
+            )
+
+        return _contains_sorted(intervals, lo, item)
 
     def __invert__(self):
-        complements = [
-            Interval.from_atomic(Bound.OPEN, -inf, self.lower, ~self.left),
-            Interval.from_atomic(~self.right, self.upper, inf, Bound.OPEN)
-        ]
+        if self.empty:
+            return Interval._from_atomics([Atomic(Bound.OPEN, -inf, inf, Bound.OPEN)])
 
-        for i, j in zip(self._intervals[:-1], self._intervals[1:]):
-            complements.append(
-                Interval.from_atomic(~i.right, i.upper, j.lower, ~j.left)
-            )
+        intervals = self._intervals
+        complements = []
+
+        first = Atomic(Bound.OPEN, -inf, intervals[0].lower, ~intervals[0].left)
+        if not _empty(first):
+            complements.append(first)
+
+        # Gaps are neither empty nor adjacent, as atomic intervals are not mergeable
+        for i, j in zip(intervals, intervals[1:]):
+            complements.append(Atomic(~i.right, i.upper, j.lower, ~j.left))
+
+        last = Atomic(~intervals[-1].right, intervals[-1].upper, inf, Bound.OPEN)
+        if not _empty(last):
+            complements.append(last)
 
-        return Interval(*complements)
+        return Interval._from_atomics(complements)
 
     def __sub__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
-            return self & ~other
+            if self.empty or other.empty:
+                return self
+            if isinstance(op, ClassicOperator):
+                return Interval._from_atomics(_difference_exact(self._intervals, other._intervals))
+            return Interval._from_atomics(_difference(self._intervals, other._intervals))
+        return NotImplemented
+
+    def __xor__(self, other):
+        if isinstance(other, Interval):
+            if other.empty:
+                return self
+            if self.empty:
+                return other
+            return Interval._from_atomics(_symmetric_difference(self._intervals, other._intervals))
         return NotImplemented
 
     def __eq__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
             if len(other._intervals) != len(self._intervals):
                 return False
@@ -534,41 +1809,58 @@ class Interval:
         return NotImplemented
 
     def __lt__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
+            c = op.cmp(self.upper, other.lower)
             if self.right is Bound.OPEN:
-                return op.le(self.upper, other.lower)
-            return op.lt(self.upper, other.lower) or (op.eq(self.upper, other.lower) and other.left is Bound.OPEN)
-        return op.lt(self.upper, other) or (self.right is Bound.OPEN and op.eq(self.upper, other))
+                return c <= 0
+            return c < 0 or (c == 0 and other.left is Bound.OPEN)
+        c = op.cmp(self.upper, other)
+        return c < 0 or (c == 0 and self.right is Bound.OPEN)
 
     def __gt__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
+            c = op.cmp(self.lower, other.upper)
             if self.left is Bound.OPEN:
-                return op.ge(self.lower, other.upper)
-            return op.gt(self.lower, other.upper) or (op.eq(self.lower, other.upper) and other.right is Bound.OPEN)
-        return op.gt(self.lower, other) or (self.left is Bound.OPEN and op.eq(self.lower, other))
+                return c >= 0
+            return c > 0 or (c == 0 and other.right is Bound.OPEN)
+        c = op.cmp(self.lower, other)
+        return c > 0 or (c == 0 and self.left is Bound.OPEN)
 
     def __le__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
+            c = op.cmp(self.upper, other.upper)
             if self.right is Bound.OPEN:
-                return op.le(self.upper, other.upper)
-            return op.lt(self.upper, other.upper) or (op.eq(self.upper, other.upper) and other.right is Bound.CLOSED)
-        return op.lt(self.lower, other) or (self.left is Bound.CLOSED and op.eq(self.lower, other))
+                return c <= 0
+            return c < 0 or (c == 0 and other.right is Bound.CLOSED)
+        c = op.cmp(self.lower, other)
+        return c < 0 or (c == 0 and self.left is Bound.CLOSED)
 
     def __ge__(self, other):
+        op = _operator.get(_default_operator)
         if isinstance(other, Interval):
+            c = op.cmp(self.lower, other.lower)
             if self.left is Bound.OPEN:
-                return op.ge(self.lower, other.lower)
-            return op.gt(self.lower, other.lower) or (op.eq(self.lower, other.lower) and other.left is Bound.CLOSED)
-        return op.gt(self.upper, other) or (self.right is Bound.CLOSED and op.eq(self.upper, other))
+                return c >= 0
+            return c > 0 or (c == 0 and other.left is Bound.CLOSED)
+        c = op.cmp(self.upper, other)
+        return c > 0 or (c == 0 and self.right is Bound.CLOSED)
 
     def __hash__(self):
-        return hash(tuple([self.lower, self.upper]))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._intervals)
+            return self._hash
 
     def __repr__(self):
+        op = _operator.get(_default_operator)
         intervals = []
 
-        for interval in self:
-            if interval.empty:
+        for interval in self._intervals:
+            if _empty(interval):
                 intervals.append('()')
             elif op.eq(interval.lower, interval.upper):
                 intervals.append('[{}]'.format(repr(interval.lower)))
@@ -584,9 +1876,10 @@ class Interval:
         return ' | '.join(intervals)
 
     def __format__(self, format_spec):
+        op = _operator.get(_default_operator)
         intervals = []
-        for interval in self:
-            if interval.empty:
+        for interval in self._intervals:
+            if _empty(interval):
                 intervals.append('()')
             elif op.eq(interval.lower, interval.upper):
                 intervals.append('[{}]'.format(format(interval.lower, format_spec)))
@@ -600,3 +1893,9 @@ class Interval:
                     )
                 )
         return ' | '.join(intervals)
+
+
+# Shared empty interval, returned by empty() and by operations whose result is empty
+_EMPTY = Interval.__new__(Interval)
+_EMPTY._intervals = _EMPTY_ATOMICS
+_EMPTY._is_empty = True
@@ -92,7 +92,7 @@ def to_string(interval, conv=repr, *, disj=' | ', sep=',', left_open='(',
             return conv(bound)
 
     exported_intervals = []
-    for item in interval:
+    for item in interval.atomics():
         left = left_open if item.left == Bound.OPEN else left_closed
         right = right_open if item.right == Bound.OPEN else right_closed
 
@@ -162,7 +162,7 @@ def to_data(interval, conv=None, *, pinf=float('inf'), ninf=float('-inf')):
         else:
             return conv(bound)
 
-    for item in interval:
+    for item in interval.atomics():
         data.append((
             item.left.value,
             _convert(item.lower),
@@ -47,6 +47,7 @@ setup(
         'sortedcontainers ~= 2.2.2',
     ],
     extras_require={
+        'numpy': ['numpy'],
         'test': ['pytest ~= 5.0.1'],
         'travis': ['coverage ~= 5.0.3', 'coveralls ~= 1.11.1']
     },
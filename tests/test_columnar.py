@@ -0,0 +1,174 @@
+import pytest
+
+import portion as P
+
+numpy = pytest.importorskip('numpy')
+
+
+def to_array(*intervals):
+    return P.ArrayInterval.from_interval(P.Interval(*intervals))
+
+
+class TestArrayInterval:
+    def test_creation(self):
+        i = P.ArrayInterval([0, 2, 5], [1, 3, 6], [P.CLOSED, P.OPEN, P.CLOSED], [P.CLOSED, P.OPEN, P.OPEN])
+        assert i.to_interval() == P.closed(0, 1) | P.open(2, 3) | P.closedopen(5, 6)
+        assert len(i) == 3
+
+        assert P.ArrayInterval([0, 2], [1, 3]).to_interval() == P.closed(0, 1) | P.closed(2, 3)
+        assert P.ArrayInterval([0, 2], [1, 3], True, False).to_interval() == P.closedopen(0, 1) | P.closedopen(2, 3)
+
+    def test_creation_with_simplification(self):
+        i = P.ArrayInterval([2, 0, 1, 5], [3, 1, 2, 4], P.CLOSED, P.OPEN)
+        assert i.to_interval() == P.closedopen(0, 3)
+        assert len(i) == 1
+
+        i = P.ArrayInterval([0, 1, 1], [1, 1, 2], [True, True, False], [False, True, False])
+        assert i.to_interval() == P.closedopen(0, 2)
+
+        assert P.ArrayInterval([0, 1], [1, 2], P.OPEN, P.OPEN).to_interval() == P.open(0, 1) | P.open(1, 2)
+
+    def test_creation_with_empty(self):
+        assert P.ArrayInterval().empty
+        assert P.ArrayInterval([1, 2, 0], [0, 2, 0], P.CLOSED, P.OPEN).empty
+        assert P.ArrayInterval().to_interval() == P.empty()
+
+    def test_creation_with_infinities(self):
+        i = P.ArrayInterval([-numpy.inf, 5], [0, numpy.inf], P.CLOSED, P.CLOSED)
+        assert i.to_interval() == P.openclosed(-P.inf, 0) | P.closedopen(5, P.inf)
+        assert i.to_interval().lower == -P.inf
+
+        i = P.ArrayInterval([numpy.inf], [numpy.inf])
+        assert i.empty
+
+    def test_creation_with_invalid_values(self):
+        with pytest.raises(ValueError):
+            P.ArrayInterval([0, 1], [2])
+        with pytest.raises(ValueError):
+            P.ArrayInterval([numpy.nan], [2])
+        with pytest.raises(ValueError):
+            P.ArrayInterval([0, 2], [1, 3], [P.CLOSED])
+        with pytest.raises(ValueError):
+            P.Interval.from_arrays([0, 2], [1, 3], [P.CLOSED])
+
+    def test_arrays_are_read_only(self):
+        i = P.ArrayInterval([0], [1])
+        assert i.lowers.tolist() == [0]
+        assert i.uppers.tolist() == [1]
+        assert i.lefts.tolist() == [True]
+        assert i.rights.tolist() == [True]
+
+        with pytest.raises(ValueError):
+            i.lowers[0] = 2
+
+    @pytest.mark.parametrize('interval', [
+        P.empty(),
+        P.closed(0, 1),
+        P.singleton(0) | P.open(1, 2) | P.closedopen(3, P.inf),
+        P.open(-P.inf, P.inf),
+    ])
+    def test_conversion(self, interval):
+        assert P.ArrayInterval.from_interval(interval).to_interval() == interval
+        assert P.ArrayInterval.from_interval(interval) == interval
+
+
+class TestArrayIntervalOperations:
+    def test_union(self):
+        i1 = to_array(P.closed(0, 1), P.open(3, 4))
+        i2 = to_array(P.openclosed(1, 2), P.closed(4, 5))
+        assert (i1 | i2).to_interval() == P.closed(0, 2) | P.openclosed(3, 5)
+        assert i1.union(i2) == i1 | i2
+        assert (P.ArrayInterval() | i1) == i1
+        assert (i1 | P.closed(1, 4)).to_interval() == P.closed(0, 4)
+
+    def test_intersection(self):
+        i1 = to_array(P.closed(0, 2), P.closed(4, 6))
+        i2 = to_array(P.closed(1, 4), P.singleton(5))
+        assert (i1 & i2).to_interval() == P.closed(1, 2) | P.singleton(4) | P.singleton(5)
+        assert i1.intersection(i2) == i1 & i2
+        assert (to_array(P.open(0, 2)) & to_array(P.open(2, 4))).empty
+        assert (to_array(P.closed(0, 2)) & to_array(P.closed(2, 4))).to_interval() == P.singleton(2)
+
+    def test_complement(self):
+        assert (~to_array(P.closed(0, 1) | P.open(2, 3))).to_interval() == ~(P.closed(0, 1) | P.open(2, 3))
+        assert (~P.ArrayInterval()).to_interval() == P.open(-P.inf, P.inf)
+        assert (~to_array(P.open(-P.inf, P.inf))).empty
+        assert (~to_array(P.openclosed(-P.inf, 0))).to_interval() == P.open(0, P.inf)
+        assert P.ArrayInterval([0], [1]).complement() == ~P.ArrayInterval([0], [1])
+
+    def test_difference(self):
+        i1 = to_array(P.closed(0, 4))
+        assert (i1 - to_array(P.closed(2, 3))).to_interval() == P.closedopen(0, 2) | P.openclosed(3, 4)
+        assert (i1 - to_array(P.open(0, 4))).to_interval() == P.singleton(0) | P.singleton(4)
+        assert (i1 - i1).empty
+        assert i1.difference(P.closed(2, 3)) == i1 - P.closed(2, 3)
+
+    def test_symmetric_difference(self):
+        i1 = to_array(P.closed(0, 2))
+        assert (i1 ^ to_array(P.closed(1, 3))).to_interval() == P.closedopen(0, 1) | P.openclosed(2, 3)
+        assert (i1 ^ to_array(P.open(0, 2))).to_interval() == P.singleton(0) | P.singleton(2)
+        assert (i1 ^ i1).empty
+        assert i1.symmetric_difference(P.closed(1, 3)) == i1 ^ P.closed(1, 3)
+
+    def test_containment(self):
+        i = to_array(P.closed(0, 1), P.open(2, 3))
+        assert 0 in i
+        assert 1 in i
+        assert 2 not in i
+        assert 2.5 in i
+        assert 5 not in i
+        assert P.closed(0, 0.5) in i
+        assert to_array(P.closed(0, 0.5), P.open(2, 3)) in i
+        assert P.closed(0, 2) not in i
+        assert i.contains(P.open(2, 3))
+
+        assert i.contains_many([-1, 0, 1.5, 2, 2.5]).tolist() == [False, True, False, False, True]
+        assert P.ArrayInterval().contains_many([0, 1]).tolist() == [False, False]
+        assert i.contains_many([[0, 2], [2.5, numpy.inf]]).shape == (2, 2)
+
+    def test_reflected_operations(self):
+        a, i = to_array(P.closed(1, 3)), P.closed(0, 2)
+        assert isinstance(i | a, P.ArrayInterval)
+        assert (i | a).to_interval() == P.closed(0, 3)
+        assert (i & a).to_interval() == P.closed(1, 2)
+        assert (i - a).to_interval() == P.closedopen(0, 1)
+        assert (a - i).to_interval() == P.openclosed(2, 3)
+        assert (i ^ a).to_interval() == P.closedopen(0, 1) | P.openclosed(2, 3)
+
+        with pytest.raises(TypeError):
+            1 | P.ArrayInterval([0], [1])
+
+    def test_conversion_with_tolerance(self):
+        a = ~P.ArrayInterval([0, 1 + 1e-9], [1, 2])
+        assert len(a.to_interval()) == 3
+
+        with P.tolerance(0, 1e-6):
+            i = a.to_interval()
+            assert i == P.open(-P.inf, 0) | P.open(2, P.inf)
+            assert all(not atomic.empty for atomic in i)
+            assert P.ArrayInterval([0, 1 + 1e-9], [1, 2]).to_interval().atomic
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.ArrayInterval([0], [1]) | 1
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_consistency_with_interval(self, seed):
+        rnd = numpy.random.RandomState(seed)
+
+        def random_array(n):
+            lowers = rnd.randint(0, 40, n) / 2
+            uppers = lowers + rnd.randint(0, 6, n) / 2
+            return P.ArrayInterval(lowers, uppers, rnd.randint(0, 2, n) == 1, rnd.randint(0, 2, n) == 1)
+
+        a1, a2 = random_array(20), random_array(20)
+        i1, i2 = a1.to_interval(), a2.to_interval()
+
+        assert (a1 | a2).to_interval() == i1 | i2
+        assert (a1 & a2).to_interval() == i1 & i2
+        assert (a1 - a2).to_interval() == i1 - i2
+        assert (a1 ^ a2).to_interval() == i1 ^ i2
+        assert (~a1).to_interval() == ~i1
+
+        values = numpy.arange(-1, 25, 0.25)
+        assert a1.contains_many(values).tolist() == [v in i1 for v in values]
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
 from portion.const import inf, _PInf, _NInf, Bound
@@ -76,3 +80,22 @@ class TestInfinities:
         assert hash(inf) is not None
         assert hash(-inf) is not None
         assert hash(inf) != hash(-inf)
+
+
+class TestFloatInfinity:
+    def test_float_infinity(self):
+        code = '\n'.join([
+            'import portion as P',
+            'assert isinstance(P.inf, float) and P.inf == float("inf")',
+            'i = P.open(-P.inf, 0) | P.closed(1, P.inf)',
+            'assert i == P.open(-float("inf"), 0) | P.closedopen(1, float("inf"))',
+            'assert ~i == P.closedopen(0, 1)',
+            'assert i & P.closed(-1, 2) == P.closedopen(-1, 0) | P.closed(1, 2)',
+            'assert P.empty() == P.open(P.inf, -P.inf) and P.empty().lower == P.inf',
+            'assert list(P.iterate(P.empty(), step=1)) == []',
+            'with P.tolerance(0, 1e-6):',
+            '    assert P.closed(0, 1) | P.closed(1 + 1e-9, P.inf) == P.closedopen(0, P.inf)',
+        ])
+        env = dict(os.environ, PORTION_FLOAT_INF='1')
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', code], env=env, cwd=root, check=True)
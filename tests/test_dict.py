@@ -1,8 +1,15 @@
+import copy
+import pickle
+
 import pytest
 
 import portion as P
 
 
+class SubIntervalDict(P.IntervalDict):
+    pass
+
+
 class TestIntervalDict:
     def test_with_single_values(self):
         d = P.IntervalDict()
@@ -137,6 +144,57 @@ class TestIntervalDict:
         assert list(v) == list(d.values())
         assert list(i) == list(d.items())
 
+    def test_shift_and_scale(self):
+        d = P.IntervalDict([(P.closedopen(0, 1), 'a'), (P.closed(2, 3) | P.closedopen(4, P.inf), 'b')])
+        assert d.shift(1) == P.IntervalDict([(P.closedopen(1, 2), 'a'), (P.closed(3, 4) | P.closedopen(5, P.inf), 'b')])
+        assert d.scale(2) == P.IntervalDict([(P.closedopen(0, 2), 'a'), (P.closed(4, 6) | P.closedopen(8, P.inf), 'b')])
+        assert d.scale(-1) == P.IntervalDict([(P.openclosed(-1, 0), 'a'), (P.closed(-3, -2) | P.openclosed(-P.inf, -4), 'b')])
+        assert list(d.scale(-1).values()) == ['b', 'a']
+        assert d.apply_monotone(lambda x: x - 1) == d.shift(-1)
+        assert P.IntervalDict().shift(1) == P.IntervalDict()
+
+        with pytest.raises(ValueError):
+            d.scale(0)
+
+    def test_shift_with_rounding(self):
+        d = P.IntervalDict([(P.closed(0, 0.5), 'a'), (P.closed(1, 40), 'b')]).shift(1e17)
+        keys = list(d.keys())
+        assert all(not a.overlaps(b) for a, b in zip(keys, keys[1:]))
+        assert d.domain() == P.closed(1e17, 1e17 + 40)
+        assert d[1e17 + 32] == 'b'
+
+        d = P.IntervalDict([(P.closedopen(0, 1), 'a'), (P.closed(1, 2), 'b')]).shift(1)
+        assert d == P.IntervalDict([(P.closedopen(1, 2), 'a'), (P.closed(2, 3), 'b')])
+
+    def test_pickling(self):
+        dicts = [
+            P.IntervalDict(),
+            P.IntervalDict([(P.closed(0, 1) | P.closed(3, P.inf), 'a'), (P.openclosed(-P.inf, -1), 'b')]),
+            P.IntervalDict([(P.closed(0.5, 1), [1]), (P.closed(2, 3.5), 2)]),
+            P.IntervalDict([(P.closed('a', 'c'), 1)]),
+        ]
+        for d in dicts:
+            e = pickle.loads(pickle.dumps(d))
+            assert e == d
+            assert list(e.keys()) == list(d.keys())
+
+    def test_pickling_subclass(self):
+        for d in [SubIntervalDict(), SubIntervalDict([(P.closed(0, 1), 'a')]), SubIntervalDict([(P.closed('a', 'c'), 1)])]:
+            for e in [pickle.loads(pickle.dumps(d)), copy.deepcopy(d)]:
+                assert type(e) is SubIntervalDict and e == d
+
+    def test_unpickling_previous_release(self):
+        # Pickled with portion 2.1.1, for P.IntervalDict([(P.closed(0, 1), 'a')])
+        d = pickle.loads(
+            b'\x80\x04\x95\xeb\x00\x00\x00\x00\x00\x00\x00\x8c\x0cportion.dict\x94\x8c\x0cIntervalDict\x94\x93\x94)'
+            b'\x81\x94N}\x94\x8c\x08_storage\x94\x8c\x1bsortedcontainers.sorteddict\x94\x8c\nSortedDict\x94\x93\x94h'
+            b'\x00\x8c\x05_sort\x94\x93\x94}\x94\x8c\x10portion.interval\x94\x8c\x08Interval\x94\x93\x94)\x81\x94N}\x94'
+            b'\x8c\n_intervals\x94]\x94h\x0c\x8c\x06Atomic\x94\x93\x94(\x8c\rportion.const\x94\x8c\x05Bound\x94\x93\x94'
+            b'\x88\x85\x94R\x94K\x00K\x01h\x19t\x94\x81\x94as\x86\x94b\x8c\x01a\x94s\x86\x94R\x94s\x86\x94b.'
+        )
+        assert d == P.IntervalDict([(P.closed(0, 1), 'a')])
+        assert d[0.5] == 'a'
+
     def test_combine_empty(self):
         add = lambda x, y: x + y
         assert P.IntervalDict().combine(P.IntervalDict(), add) == P.IntervalDict()
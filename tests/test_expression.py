@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+import portion as P
+
+
+class TestLazy:
+    def test_lazy(self):
+        i = P.lazy(P.closed(0, 1))
+        assert isinstance(i, P.LazyInterval)
+        assert P.lazy(i) is i
+        assert i.evaluate() == P.closed(0, 1)
+
+        with pytest.raises(TypeError):
+            P.lazy(1)
+
+    def test_operations(self):
+        a, b, c = P.closed(0, 2), P.open(1, 3), P.closed(2, 4)
+        assert (P.lazy(a) | b).evaluate() == P.closedopen(0, 3)
+        assert (P.lazy(a) & b).evaluate() == P.openclosed(1, 2)
+        assert (P.lazy(a) - b).evaluate() == P.closed(0, 1)
+        assert (P.lazy(a) ^ b).evaluate() == P.closed(0, 1) | P.open(2, 3)
+        assert (~P.lazy(a)).evaluate() == P.open(-P.inf, 0) | P.open(2, P.inf)
+        assert ((P.lazy(a) | b) & ~P.lazy(c)).evaluate() == P.closedopen(0, 2)
+
+    def test_reflected_operations(self):
+        a, b = P.closed(0, 2), P.open(1, 3)
+        assert (a | P.lazy(b)).evaluate() == a | b
+        assert (a & P.lazy(b)).evaluate() == a & b
+        assert (a - P.lazy(b)).evaluate() == a - b
+        assert (a ^ P.lazy(b)).evaluate() == a ^ b
+
+        with pytest.raises(TypeError):
+            P.lazy(a) | 1
+
+    def test_empty_and_infinities(self):
+        assert P.lazy(P.empty()).evaluate() == P.empty()
+        assert (~P.lazy(P.empty())).evaluate() == P.open(-P.inf, P.inf)
+        assert (~P.lazy(P.open(-P.inf, P.inf))).evaluate() == P.empty()
+        assert (~P.lazy(P.openclosed(-P.inf, 0) | P.closedopen(1, P.inf))).evaluate() == P.open(0, 1)
+        assert (P.lazy(P.closedopen(0, P.inf)) - P.closed(1, 2)).evaluate() == P.closedopen(0, 1) | P.open(2, P.inf)
+
+    def test_shared_leaves(self):
+        a, b = P.closed(0, 2), P.closed(1, 3)
+        expression = (P.lazy(a) - b) | (P.lazy(b) - a)
+        assert expression.leaves() == [a, b]
+        assert expression.evaluate() == a ^ b
+        assert (P.lazy(a) ^ a).evaluate() == P.empty()
+
+    def test_same_as_eager(self):
+        rnd = random.Random(42)
+        operations = ['|', '&', '-', '^']
+
+        def interval():
+            return P.Interval(*[
+                P.Interval.from_atomic(rnd.choice([P.OPEN, P.CLOSED]), x, x + rnd.randint(0, 3), rnd.choice([P.OPEN, P.CLOSED]))
+                for x in (rnd.randint(0, 20) for _ in range(rnd.randint(0, 4)))
+            ])
+
+        def combine(x, y, operation):
+            return {'|': x | y, '&': x & y, '-': x - y, '^': x ^ y}[operation]
+
+        for _ in range(200):
+            leaves = [interval() for _ in range(rnd.randint(2, 8))]
+            eager, lazy = leaves[0], P.lazy(leaves[0])
+            for leaf in leaves[1:]:
+                operation = rnd.choice(operations)
+                eager, lazy = combine(eager, leaf, operation), combine(lazy, leaf, operation)
+                if rnd.random() < 0.2:
+                    eager, lazy = ~eager, ~lazy
+
+            result = lazy.evaluate()
+            assert result == eager
+            assert list(result.atomics()) == list(eager.atomics())
+
+    def test_with_tolerance(self):
+        a, b = P.closed(0, 1), P.closed(1 + 1e-9, 2)
+        assert (P.lazy(a) | b).evaluate() == P.closed(0, 1) | P.closed(1 + 1e-9, 2)
+        with P.tolerance(0, 1e-6):
+            assert (P.lazy(a) | b).evaluate() == P.closed(0, 2)
+
+    def test_repr(self):
+        expression = ~(P.lazy(P.closed(0, 1)) | P.open(2, 3)) - P.empty()
+        assert repr(expression) == '(~(lazy([0,1]) | lazy((2,3))) - lazy(()))'
@@ -1,3 +1,5 @@
+import operator
+
 import pytest
 
 import portion as P
@@ -54,3 +56,162 @@ class TestIterate:
         assert next(gen) == 0
         assert next(gen) == -1
         assert next(gen) == -2  # and so on
+
+
+class TestUnionAll:
+    def test_union_all(self):
+        assert P.union_all([P.closed(0, 1), P.closed(4, 5), P.open(1, 2)]) == P.closedopen(0, 2) | P.closed(4, 5)
+        assert P.union_all([P.closed(0, 1) | P.closed(2, 3), P.open(1, 2)]) == P.closed(0, 3)
+        assert P.union_all([P.closedopen(0, 1), P.open(1, 2)]) == P.closedopen(0, 1) | P.open(1, 2)
+        assert P.union_all(iter([P.closed(0, 1)])) == P.closed(0, 1)
+
+    def test_with_empty(self):
+        assert P.union_all([]) == P.empty()
+        assert P.union_all([P.empty(), P.empty()]) == P.empty()
+        assert P.union_all([P.empty(), P.closed(0, 1), P.empty()]) == P.closed(0, 1)
+
+    def test_with_many_intervals(self):
+        intervals = [P.closed(x, x + 1) | P.closed(x + 1000, x + 1001) for x in range(0, 200, 3)]
+        assert P.union_all(intervals) == P.Interval(*intervals)
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.union_all([P.closed(0, 1), 1])
+
+
+class TestIntersectionAll:
+    def test_intersection_all(self):
+        assert P.intersection_all([P.closed(0, 3), P.closed(1, 4) | P.closed(5, 6), P.open(2, 5)]) == P.openclosed(2, 3)
+        assert P.intersection_all([P.closed(0, 3), P.closed(3, 4)]) == P.singleton(3)
+        assert P.intersection_all([P.closed(0, 3), P.open(3, 4)]) == P.empty()
+        assert P.intersection_all(iter([P.closed(0, 1)])) == P.closed(0, 1)
+
+    def test_with_empty(self):
+        assert P.intersection_all([]) == P.open(-P.inf, P.inf)
+        assert P.intersection_all([P.closed(0, 1), P.empty()]) == P.empty()
+
+    def test_with_many_intervals(self):
+        intervals = [
+            P.Interval(*[P.closed(x, x + 2) for x in range(i, 100, 10)]) for i in range(3)
+        ]
+        expected = P.Interval(*[P.closed(x + 2, x + 2) for x in range(0, 98, 10)])
+        assert P.intersection_all(intervals) == expected
+        assert P.intersection_all(intervals) == intervals[0] & intervals[1] & intervals[2]
+
+    def test_with_tolerance(self):
+        with P.tolerance(0, 1e-6):
+            intervals = [P.closed(0, 2), P.open(1e-9, 3), P.closed(-1, 1 + 1e-9)]
+            assert P.intersection_all(intervals) == P.openclosed(0, 1)
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.intersection_all([P.closed(0, 1), 1])
+
+
+class TestCoverage:
+    def test_coverage(self):
+        d = P.coverage([P.closed(0, 2), P.open(1, 3), P.closed(2, 4) | P.closed(6, 7)])
+        assert d == P.IntervalDict([
+            (P.closed(0, 1) | P.closed(3, 4) | P.closed(6, 7), 1),
+            (P.open(1, 2) | P.open(2, 3), 2),
+            (P.singleton(2), 3),
+        ])
+        assert d[2.5] == 2
+
+    def test_adjacent_intervals(self):
+        assert P.coverage([P.closedopen(0, 1), P.closed(1, 2)]) == P.IntervalDict([(P.closed(0, 2), 1)])
+        assert P.coverage([P.closed(0, 1), P.openclosed(1, 2)]) == P.IntervalDict([(P.closed(0, 2), 1)])
+        assert P.coverage([P.closed(0, 1), P.closed(1, 2)]) == P.IntervalDict([
+            (P.closedopen(0, 1) | P.openclosed(1, 2), 1), (P.singleton(1), 2),
+        ])
+
+    def test_with_empty_and_infinities(self):
+        assert P.coverage([]) == P.IntervalDict()
+        assert P.coverage([P.empty(), P.empty()]) == P.IntervalDict()
+        assert P.coverage([P.open(-P.inf, P.inf), P.closedopen(0, P.inf)]) == P.IntervalDict([
+            (P.open(-P.inf, 0), 1), (P.closedopen(0, P.inf), 2),
+        ])
+
+    def test_same_as_combine(self):
+        intervals = [P.closed(x % 17, x % 17 + x % 5) | P.open(x % 11 + 20, x % 7 + 25) for x in range(50)]
+        expected = P.IntervalDict()
+        for interval in intervals:
+            expected = expected.combine(P.IntervalDict([(interval, 1)]), operator.add)
+        assert P.coverage(intervals) == expected
+
+    def test_at_least(self):
+        intervals = [P.closed(0, 2), P.open(1, 3), P.closed(2, 4) | P.closed(6, 7)]
+        assert P.at_least(intervals, 0) == P.open(-P.inf, P.inf)
+        assert P.at_least(intervals, 1) == P.closed(0, 4) | P.closed(6, 7)
+        assert P.at_least(intervals, 2) == P.open(1, 3)
+        assert P.at_least(intervals, 3) == P.singleton(2)
+        assert P.at_least(intervals, 4) == P.empty()
+
+    def test_at_most(self):
+        intervals = [P.closed(0, 2), P.open(1, 3), P.closed(2, 4) | P.closed(6, 7)]
+        assert P.at_most(intervals, 0) == P.open(-P.inf, 0) | P.open(4, 6) | P.open(7, P.inf)
+        assert P.at_most(intervals, 1) == P.openclosed(-P.inf, 1) | P.closedopen(3, P.inf)
+        assert P.at_most(intervals, 2) == P.open(-P.inf, 2) | P.open(2, P.inf)
+        assert P.at_most(intervals, 3) == P.open(-P.inf, P.inf)
+        assert P.at_most([], 0) == P.open(-P.inf, P.inf)
+
+    def test_with_tolerance(self):
+        intervals = [P.closed(0, 1), P.closed(1 + 1e-9, 2)]
+        assert P.at_least(intervals, 1) == P.closed(0, 1) | P.closed(1 + 1e-9, 2)
+        assert len(P.at_most(intervals, 0)) == 3
+
+        with P.tolerance(0, 1e-6):
+            assert P.at_least(intervals, 1) == P.union_all(intervals) == P.closed(0, 2)
+            assert list(P.at_least(intervals, 1).atomics()) == list(P.closed(0, 2).atomics())
+            assert P.at_most(intervals, 0) == P.open(-P.inf, 0) | P.open(2, P.inf)
+            assert all(not i.empty for i in P.at_most(intervals, 0))
+
+            d = P.coverage(intervals)
+            assert list(d.keys()) == [P.closed(0, 2)]
+            assert list(d.keys())[0].atomic
+            assert d[1 + 5e-10] == 1
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.coverage([P.closed(0, 1), 1])
+
+
+class TestJoin:
+    def test_join(self):
+        first = [P.closed(0, 2), P.open(3, 5), P.closed(10, 11)]
+        second = [P.closed(1, 3), P.closed(5, 6), P.closed(4, 4)]
+        assert sorted(P.join(first, second)) == [(0, 0), (1, 2)]
+        assert list(P.join(first, [])) == []
+        assert list(P.join([], second)) == []
+
+    def test_open_and_closed_bounds(self):
+        assert list(P.join([P.closed(0, 1)], [P.closed(1, 2)])) == [(0, 0)]
+        assert list(P.join([P.closedopen(0, 1)], [P.closed(1, 2)])) == []
+        assert list(P.join([P.closed(0, 1)], [P.openclosed(1, 2)])) == []
+        assert list(P.join([P.singleton(1)], [P.closed(1, 2), P.openclosed(1, 2)])) == [(0, 0)]
+
+    def test_non_atomic_intervals(self):
+        first = [P.closed(0, 1) | P.closed(3, 4) | P.closed(6, 7), P.empty()]
+        second = [P.closed(0, 10), P.open(1, 3), P.closed(4, 6)]
+        assert sorted(P.join(first, second)) == [(0, 0), (0, 2)]
+
+    def test_same_as_overlaps(self):
+        first = [P.closed(x % 13, x % 13 + x % 3) | P.open(x % 7 + 20, x % 5 + 22) for x in range(40)]
+        second = [P.closedopen(x % 17, x % 17 + 1) | P.closed(x + 15, x + 16) for x in range(40)]
+        expected = [(i, j) for i, a in enumerate(first) for j, b in enumerate(second) if a.overlaps(b)]
+        assert sorted(P.join(first, second)) == expected
+        assert sorted(P.join(iter(first), iter(second))) == expected
+
+    def test_how(self):
+        first, second = [P.closed(0, 2), P.closed(4, 6)], [P.closed(1, 5)]
+        assert sorted(P.join(first, second, how=lambda i: i)) == [(0, 0, P.closed(1, 2)), (1, 0, P.closed(4, 5))]
+
+    def test_with_tolerance(self):
+        first, second = [P.closed(0, 1), P.closed(2, 3)], [P.closed(1 + 1e-9, 2 - 1e-9), P.openclosed(3, 4)]
+        assert list(P.join(first, second)) == []
+        with P.tolerance(0, 1e-6):
+            assert sorted(P.join(first, second)) == [(0, 0), (1, 0)]
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.join([P.closed(0, 1)], [1])
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+import portion as P
+
+
+@pytest.fixture
+def intervals():
+    return [
+        P.closed(0, 10),
+        P.closed(2, 3) | P.open(5, 6),
+        P.closedopen(2, 3),
+        P.empty(),
+        P.openclosed(-P.inf, -1),
+        P.singleton(6),
+        P.closed(8, 12) | P.closedopen(20, P.inf),
+    ]
+
+
+class TestIntervalIndex:
+    def test_creation(self, intervals):
+        index = P.IntervalIndex(intervals)
+        assert len(index) == len(intervals)
+        assert len(P.IntervalIndex([])) == 0
+        assert len(P.IntervalIndex(iter(intervals))) == len(intervals)
+
+        with pytest.raises(TypeError):
+            P.IntervalIndex([P.closed(0, 1), 1])
+
+    def test_containing(self, intervals):
+        index = P.IntervalIndex(intervals)
+        assert index.containing(2) == [0, 1, 2]
+        assert index.containing(3) == [0, 1]
+        assert index.containing(5) == [0]
+        assert index.containing(6) == [0, 5]
+        assert index.containing(11) == [6]
+        assert index.containing(15) == []
+        assert index.containing(-1) == [4]
+        assert index.containing(-100) == [4]
+        assert index.containing(100) == [6]
+        assert index.containing(P.inf) == []
+
+    def test_overlapping(self, intervals):
+        index = P.IntervalIndex(intervals)
+        assert index.overlapping(P.closed(3, 5)) == [0, 1]
+        assert index.overlapping(P.open(3, 5)) == [0]
+        assert index.overlapping(P.closed(-1, 0)) == [0, 4]
+        assert index.overlapping(P.open(12, 20)) == []
+        assert index.overlapping(P.closed(11, 11) | P.closed(-5, -4)) == [4, 6]
+        assert index.overlapping(P.empty()) == []
+        assert index.overlapping(P.open(-P.inf, P.inf)) == [0, 1, 2, 4, 5, 6]
+
+        with pytest.raises(TypeError):
+            index.overlapping(1)
+
+    def test_nested_intervals(self):
+        intervals = [P.closed(i, 100 - i) for i in range(50)] + [P.closed(40, 45), P.closed(40, 60)]
+        index = P.IntervalIndex(intervals)
+        assert index.containing(5) == list(range(6))
+        assert index.containing(50) == list(range(50)) + [51]
+        assert index.overlapping(P.open(45, 46)) == list(range(46)) + [51]
+
+    def test_same_as_scan(self):
+        rnd = random.Random(42)
+
+        def interval():
+            return P.Interval(*[
+                P.Interval.from_atomic(rnd.choice([P.OPEN, P.CLOSED]), x, x + rnd.randint(0, 5), rnd.choice([P.OPEN, P.CLOSED]))
+                for x in (rnd.randint(0, 50) for _ in range(rnd.randint(0, 3)))
+            ])
+
+        intervals = [interval() for _ in range(200)]
+        index = P.IntervalIndex(intervals)
+        for value in range(-1, 57):
+            assert index.containing(value) == [k for k, i in enumerate(intervals) if value in i]
+        for _ in range(100):
+            query = interval()
+            assert index.overlapping(query) == [k for k, i in enumerate(intervals) if i.overlaps(query)]
+
+    def test_with_tolerance(self):
+        index = P.IntervalIndex([P.closed(0, 1), P.openclosed(1 + 1e-9, 2), P.closed(2 + 1e-9, 3)])
+        assert index.containing(1) == [0]
+        assert index.containing(2) == [1]
+        assert index.overlapping(P.closed(1 - 1e-9, 1)) == [0]
+
+        with P.tolerance(0, 1e-6):
+            assert index.containing(1) == [0]
+            assert index.containing(2) == [1, 2]
+            assert index.containing(1 + 1e-8) == [0]
+            assert index.overlapping(P.closed(1 + 1e-8, 1 + 2e-8)) == [0]
+            assert index.overlapping(P.closed(3 + 1e-9, 4)) == [2]
@@ -1,6 +1,23 @@
+import copy
+import pickle
+import random
+import threading
+
 import pytest
 
 import portion as P
+from portion.fuzzy_operator import ClassicOperator, FuzzyOperator, QuantizedOperator
+
+
+class SubInterval(P.Interval):
+    pass
+
+
+@pytest.fixture
+def tolerance():
+    P.set_tolerance(0, 1e-6)
+    yield
+    P.set_operator(ClassicOperator())
 
 
 class TestHelpers:
@@ -62,6 +79,27 @@ class TestInterval:
         with pytest.raises(TypeError):
             P.Interval(1)
 
+    def test_creation_with_many_intervals(self):
+        assert P.Interval(*[P.closed(i, i + 1) for i in range(1000)]) == P.closed(0, 1000)
+        assert P.Interval(*[P.closedopen(i, i + 1) for i in reversed(range(1000))]) == P.closedopen(0, 1000)
+        assert len(P.Interval(*[P.open(i, i + 1) for i in range(1000)])) == 1000
+        assert P.Interval(*[P.closed(0, i) for i in range(1, 1000)] + [P.open(-1, 0)]) == P.openclosed(-1, 999)
+
+    def test_shared_empty(self):
+        assert P.empty() is P.empty()
+        assert P.closed(1, 0) is P.empty()
+        assert P.open(0, 0) is P.empty()
+        assert P.closed(0, 1) & P.closed(2, 3) is P.empty()
+        assert P.closed(0, 1) - P.closed(0, 1) is P.empty()
+        assert P.Interval().empty and P.Interval().atomic
+        assert P.Interval()._intervals is P.empty()._intervals
+        assert pickle.loads(pickle.dumps(P.empty())) == P.empty()
+
+    def test_infinite_bounds_are_open(self):
+        assert P.closed(-P.inf, P.inf) == P.open(-P.inf, P.inf)
+        assert P.closed(0, P.inf).right == P.OPEN
+        assert P.closed(-P.inf, 0).left == P.OPEN
+
     def test_creation_issue_19(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/19
         assert P.Interval(P.empty(), P.empty()) == P.empty()
@@ -119,6 +157,78 @@ class TestInterval:
         assert hash(P.closed(0, 1) | P.closed(3, 4)) != hash(P.closed(0, 1))
         assert hash(P.closed(0, 1) | P.closed(3, 4)) != hash(P.closed(3, 4))
 
+    def test_hash_with_same_enclosure(self):
+        i1 = P.closed(0, 1) | P.closed(3, 4)
+        i2 = P.closed(0, 2) | P.closed(3, 4)
+        i3 = P.closed(0, 1) | P.open(3, 4) | P.singleton(4)
+        assert hash(i1) != hash(i2)
+        assert hash(i1) != hash(P.closed(0, 4))
+        assert hash(i3) != hash(P.closed(0, 4))
+        assert len({i1, i2, i3, P.closed(0, 4)}) == 4
+        assert hash(i1) == hash(P.closed(3, 4) | P.closed(0, 1))
+
+    def test_hash_after_pickling(self):
+        i = P.closed(0, 1) | P.closed(3, 4)
+        j = pickle.loads(pickle.dumps(i))
+        assert j == i and hash(j) == hash(i)
+        assert not j.empty
+        assert pickle.loads(pickle.dumps(P.empty())).empty
+
+    def test_pickling(self):
+        intervals = [
+            P.closed(0.5, 1.5) | P.open(2.0, P.inf),
+            P.openclosed(-P.inf, 0) | P.closedopen(1, 2),
+            P.open(-P.inf, P.inf),
+            P.closed(2 ** 70, 2 ** 71),
+            P.closed(1, 2.5),
+            P.closed('a', 'b') | P.singleton('c'),
+        ]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for i in intervals:
+                j = pickle.loads(pickle.dumps(i, protocol=protocol))
+                assert j == i and list(j.atomics()) == list(i.atomics())
+                assert [type(v) for s in j.atomics() for v in s[1:3]] == [type(v) for s in i.atomics() for v in s[1:3]]
+
+    def test_unpickling_previous_release(self):
+        # Pickled with portion 2.1.1, for P.closed(0, 1) | P.openclosed(2.5, P.inf) and P.empty()
+        payloads = [
+            b'\x80\x02cportion.interval\nInterval\nq\x00)\x81q\x01N}q\x02X\n\x00\x00\x00_intervalsq\x03]q\x04('
+            b'cportion.interval\nAtomic\nq\x05(cportion.const\nBound\nq\x06\x88\x85q\x07Rq\x08K\x00K\x01h\x08tq'
+            b'\t\x81q\nh\x05(h\x06\x89\x85q\x0bRq\x0cG@\x04\x00\x00\x00\x00\x00\x00cportion.const\n_PInf\nq\r)'
+            b'\x81q\x0eh\x0ctq\x0f\x81q\x10es\x86q\x11b.',
+            b'\x80\x04\x95\x9b\x00\x00\x00\x00\x00\x00\x00\x8c\x10portion.interval\x94\x8c\x08Interval\x94\x93\x94)'
+            b'\x81\x94N}\x94\x8c\n_intervals\x94]\x94(h\x00\x8c\x06Atomic\x94\x93\x94(\x8c\rportion.const\x94\x8c'
+            b'\x05Bound\x94\x93\x94\x88\x85\x94R\x94K\x00K\x01h\rt\x94\x81\x94h\x08(h\x0b\x89\x85\x94R\x94G@\x04'
+            b'\x00\x00\x00\x00\x00\x00h\t\x8c\x05_PInf\x94\x93\x94)\x81\x94h\x11t\x94\x81\x94es\x86\x94b.',
+        ]
+        for payload in payloads:
+            i = pickle.loads(payload)
+            assert i == P.closed(0, 1) | P.openclosed(2.5, P.inf)
+            assert isinstance(i._intervals, tuple)
+            assert hash(i) == hash(P.closed(0, 1) | P.openclosed(2.5, P.inf))
+
+        empty = pickle.loads(
+            b'\x80\x04\x95\x8c\x00\x00\x00\x00\x00\x00\x00\x8c\x10portion.interval\x94\x8c\x08Interval\x94\x93\x94)'
+            b'\x81\x94N}\x94\x8c\n_intervals\x94]\x94h\x00\x8c\x06Atomic\x94\x93\x94(\x8c\rportion.const\x94\x8c\x05'
+            b'Bound\x94\x93\x94\x89\x85\x94R\x94h\t\x8c\x05_PInf\x94\x93\x94)\x81\x94h\t\x8c\x05_NInf\x94\x93\x94)'
+            b'\x81\x94h\rt\x94\x81\x94as\x86\x94b.'
+        )
+        assert empty.empty and empty == P.empty()
+
+    def test_pickling_subclass(self):
+        intervals = [
+            SubInterval(),
+            SubInterval(P.closed(0.5, 1.5) | P.open(2.0, P.inf)),
+            SubInterval(P.closed('a', 'b')),
+        ]
+        for i in intervals:
+            for j in [pickle.loads(pickle.dumps(i)), copy.deepcopy(i)]:
+                assert type(j) is SubInterval and j == i
+
+    def test_pickling_is_compact(self):
+        i = P.Interval.from_arrays([float(x) for x in range(1000)], [x + 0.5 for x in range(1000)])
+        assert len(pickle.dumps(i)) < 1000 * 20
+
     def test_hash_with_unhashable(self):
         # Let's create a comparable but no hashable object
         class T(int):
@@ -138,6 +248,135 @@ class TestInterval:
         assert P.open(0, 1) == P.open(0, 1).enclosure
         assert P.closed(0, 4) == (P.closed(0, 1) | P.closed(3, 4)).enclosure
         assert P.openclosed(0, 4) == (P.open(0, 1) | P.closed(3, 4)).enclosure
+        assert P.empty() == P.empty().enclosure
+
+    def test_immutability(self):
+        i = P.closed(0, 1) | P.closed(3, 4)
+        assert i.enclosure is i.enclosure
+        with pytest.raises(AttributeError):
+            i.foo = 1
+        with pytest.raises(TypeError):
+            i.atomics()[0] = P.closed(0, 2)
+        with pytest.raises(TypeError):
+            i._intervals[0] = P.closed(0, 2)
+
+
+class TestIntervalCompact:
+    def test_compact(self):
+        i = P.openclosed(-P.inf, 0.0) | P.closed(1.0, 2.0) | P.open(3.0, P.inf)
+        c = i.compact()
+        assert c == i and i == c
+        assert hash(c) == hash(i)
+        assert list(c.atomics()) == list(i.atomics())
+        assert list(c) == list(i) and c[1] == i[1] and c[-1] == i[-1] and c[1:] == i[1:]
+        assert (c.left, c.lower, c.upper, c.right) == (i.left, i.lower, i.upper, i.right)
+        assert c.compact() is c
+        assert repr(c) == repr(i)
+
+    def test_not_compacted(self):
+        for i in [P.empty(), P.closed('a', 'b'), P.closed(1, 2.5), P.closed(2 ** 70, 2 ** 71)]:
+            assert i.compact() is i
+        assert P.closed(1, 2).compact() == P.closed(1, 2)
+        assert P.closed(1, 2).compact().lower == 1
+
+    def test_pickling(self):
+        c = (P.closed(0.0, 1.0) | P.open(2.0, P.inf)).compact()
+        for copied in [pickle.loads(pickle.dumps(c)), copy.deepcopy(c), copy.copy(c)]:
+            assert copied == c
+            assert isinstance(copied._intervals, type(c._intervals))
+            assert copied.compact() is copied
+
+        i = P.closed(0.0, 1.0) | P.open(2.0, P.inf)
+        assert isinstance(pickle.loads(pickle.dumps(i))._intervals, tuple)
+
+    def test_same_as_tuples(self):
+        rnd = random.Random(42)
+
+        def interval():
+            return P.Interval(*[
+                P.Interval.from_atomic(rnd.choice([P.OPEN, P.CLOSED]), x, x + rnd.randint(0, 3), rnd.choice([P.OPEN, P.CLOSED]))
+                for x in (rnd.randint(0, 30) for _ in range(rnd.randint(0, 6)))
+            ])
+
+        for _ in range(100):
+            i, j = interval(), interval()
+            c = i.compact()
+            assert c == i
+            assert c | j == i | j and j | c == j | i
+            assert c & j == i & j and c - j == i - j and c ^ j == i ^ j and ~c == ~i
+            assert (j in c) == (j in i) and (c in j) == (i in j)
+            assert all((x in c) == (x in i) for x in range(-1, 35))
+            assert c.clip(j) == i.clip(j) and c.replace(upper=20) == i.replace(upper=20)
+
+    def test_with_tolerance(self, tolerance):
+        c = (P.closed(0.0, 1.0) | P.closed(2.0, 3.0)).compact()
+        assert 1 + 1e-9 in c
+        assert c | P.closed(1 + 1e-9, 2.0) == P.closed(0.0, 3.0)
+
+
+class TestIntervalFromArrays:
+    def test_creation(self):
+        assert P.Interval.from_arrays([], []) == P.empty()
+        assert P.Interval.from_arrays([0], [1]) == P.closed(0, 1)
+        assert P.Interval.from_arrays([3, 0, 1], [4, 1, 2], P.OPEN, P.CLOSED) == P.openclosed(0, 2) | P.openclosed(3, 4)
+        assert P.Interval.from_arrays(['c', 'a'], ['d', 'b']) == P.closed('a', 'b') | P.closed('c', 'd')
+
+    def test_boundaries(self):
+        assert P.Interval.from_arrays([0, 1], [1, 2], [P.CLOSED, P.OPEN], [False, True]) == P.closedopen(0, 1) | P.openclosed(1, 2)
+        assert P.Interval.from_arrays([0, 0], [1, 1], [P.OPEN, P.CLOSED], P.OPEN) == P.closedopen(0, 1)
+        assert P.Interval.from_arrays([0, 1], [1, 2], True, False) == P.closedopen(0, 2)
+
+        with pytest.raises(ValueError):
+            P.Interval.from_arrays([0, 1], [1])
+        with pytest.raises(ValueError):
+            P.Interval.from_arrays([0, 1], [1, 2], [P.CLOSED])
+
+    def test_empty_atomics_are_ignored(self):
+        assert P.Interval.from_arrays([1, 2, 3], [0, 2, 3], P.CLOSED, [P.CLOSED, P.OPEN, P.CLOSED]) == P.singleton(3)
+        assert P.Interval.from_arrays([1, 2], [0, 2], P.OPEN) == P.empty()
+        assert P.Interval.from_arrays([P.inf], [P.inf]) == P.empty()
+
+    def test_infinities(self):
+        i = P.Interval.from_arrays([-P.inf, 1], [0, float('inf')])
+        assert i == P.openclosed(-P.inf, 0) | P.closedopen(1, P.inf)
+        assert i.left == P.OPEN and i.right == P.OPEN
+        assert i.lower is -P.inf and i.upper is P.inf
+        assert P.Interval.from_arrays([float('-inf')], [float('inf')]) == P.open(-P.inf, P.inf)
+
+    def test_presorted(self):
+        lowers, uppers = list(range(0, 100, 2)), list(range(1, 101, 2))
+        assert P.Interval.from_arrays(lowers, uppers, presorted=True) == P.Interval(*map(P.closed, lowers, uppers))
+        assert P.Interval.from_arrays([0, 1], [2, 3], presorted=True) == P.closed(0, 3)
+
+    def test_same_as_from_atomic(self):
+        rnd = random.Random(42)
+        for _ in range(100):
+            n = rnd.randint(0, 10)
+            lowers = [rnd.randint(0, 10) for _ in range(n)]
+            uppers = [rnd.randint(0, 10) for _ in range(n)]
+            lefts = [rnd.choice([P.OPEN, P.CLOSED]) for _ in range(n)]
+            rights = [rnd.choice([P.OPEN, P.CLOSED]) for _ in range(n)]
+
+            i = P.Interval.from_arrays(lowers, uppers, lefts, rights)
+            assert i == P.Interval(*map(P.Interval.from_atomic, lefts, lowers, uppers, rights))
+
+    def test_numpy_arrays(self):
+        numpy = pytest.importorskip('numpy')
+        i = P.Interval.from_arrays(
+            numpy.array([2.0, 0.0, -numpy.inf]), numpy.array([3.0, 1.0, -1.0]),
+            numpy.array([True, False, True]), P.CLOSED,
+        )
+        assert i == P.openclosed(-P.inf, -1) | P.openclosed(0, 1) | P.closed(2, 3)
+        assert all(type(a.lower) is not numpy.float64 for a in i.atomics())
+
+    def test_with_tolerance(self, tolerance):
+        assert P.Interval.from_arrays([0, 1 + 1e-9], [1, 2]) == P.closed(0, 2)
+        assert P.Interval.from_arrays([1], [1 - 1e-9], P.OPEN) == P.empty()
+
+    def test_quantized(self):
+        with P.tolerance(0, 0.5, quantized=True):
+            i = P.Interval.from_arrays([0.1, 1.1], [0.9, 2.2])
+        assert i == P.closed(0, 2)
 
 
 class TestIntervalReplace:
@@ -174,6 +413,98 @@ class TestIntervalReplace:
         assert P.empty().replace(lower=lambda v: 1, upper=lambda v: 2, ignore_inf=False) == P.open(1, 2)
 
 
+class TestIntervalClip:
+    def test_clip(self):
+        i = P.closed(0, 1) | P.closed(2, 3) | P.closed(4, 5) | P.closed(6, 7)
+        assert i.clip(P.closed(2.5, 4.5)) == P.closed(2.5, 3) | P.closed(4, 4.5)
+        assert i.clip(P.closed(1.5, 5.5)) == P.closed(2, 3) | P.closed(4, 5)
+        assert i.clip(P.open(1, 6)) == P.closed(2, 3) | P.closed(4, 5)
+        assert i.clip(P.closed(1, 6)) == P.singleton(1) | P.closed(2, 3) | P.closed(4, 5) | P.singleton(6)
+        assert i.clip(P.open(-P.inf, P.inf)) == i
+        assert i.clip(P.open(3, 4)) == P.empty()
+        assert i.clip(P.closed(8, 9)) == P.empty()
+        assert i.clip(P.closed(-2, -1)) == P.empty()
+
+    def test_with_empty(self):
+        assert P.empty().clip(P.closed(0, 1)) == P.empty()
+        assert P.closed(0, 1).clip(P.empty()) == P.empty()
+
+    def test_non_atomic_window(self):
+        i = P.closed(0, 1) | P.closed(2, 3) | P.closed(4, 5)
+        assert i.clip(P.closed(0.5, 2.5) | P.open(4.5, 10)) == P.closed(0.5, 1) | P.closed(2, 2.5) | P.openclosed(4.5, 5)
+
+    def test_same_as_intersection(self):
+        i = P.Interval(*[P.closedopen(x, x + 0.5) for x in range(100)]) | P.openclosed(200, P.inf)
+        for lower in range(-2, 210, 7):
+            for window in [P.closed(lower, lower + 3.5), P.open(lower + 0.5, lower + 10), P.closedopen(lower, P.inf)]:
+                assert i.clip(window) == i & window
+
+        with pytest.raises(TypeError):
+            i.clip(1)
+
+    def test_with_tolerance(self, tolerance):
+        i = P.closed(0, 1) | P.closed(2, 3)
+        assert i.clip(P.open(1 + 1e-9, 2 - 1e-9)) == P.empty()
+        assert i.clip(P.closed(1 + 1e-9, 2 - 1e-9)) == P.closed(1 + 1e-9, 1) | P.closed(2, 2 - 1e-9)
+
+
+class TestIntervalShiftScale:
+    def test_shift(self):
+        i = P.closedopen(0, 1) | P.openclosed(2, 3)
+        assert i.shift(10) == P.closedopen(10, 11) | P.openclosed(12, 13)
+        assert i.shift(-1) == P.closedopen(-1, 0) | P.openclosed(1, 2)
+        assert P.singleton(1).shift(1) == P.singleton(2)
+        assert P.openclosed(-P.inf, 0).shift(1) == P.openclosed(-P.inf, 1)
+        assert P.open(-P.inf, P.inf).shift(1) == P.open(-P.inf, P.inf)
+        assert P.empty().shift(1) == P.empty()
+
+    def test_scale(self):
+        i = P.closedopen(1, 2) | P.openclosed(3, 4)
+        assert i.scale(2) == P.closedopen(2, 4) | P.openclosed(6, 8)
+        assert i.scale(-1) == P.closedopen(-4, -3) | P.openclosed(-2, -1)
+        assert list(i.scale(-1)) == [P.closedopen(-4, -3), P.openclosed(-2, -1)]
+        assert (P.openclosed(-P.inf, 0) | P.closed(1, P.inf)).scale(-2) == P.openclosed(-P.inf, -2) | P.closedopen(0, P.inf)
+        assert P.empty().scale(-1) == P.empty()
+
+        with pytest.raises(ValueError):
+            i.scale(0)
+
+    def test_apply_monotone(self):
+        i = P.closed(1, 2) | P.open(3, 4) | P.closedopen(5, P.inf)
+        assert i.apply_monotone(lambda x: x ** 3) == i.apply(lambda s: s.replace(lower=lambda x: x ** 3, upper=lambda x: x ** 3))
+        assert i.apply_monotone(lambda x: -x ** 3, decreasing=True) == P.openclosed(-P.inf, -125) | P.open(-64, -27) | P.closed(-8, -1)
+
+    def test_merge_after_rounding(self):
+        i = P.closed(0, 1) | P.open(1 + 1e-17, 2)
+        assert i.apply_monotone(lambda x: round(x)) == P.closedopen(0, 2)
+        assert P.open(1e16, 1e16 + 2).shift(0.5).empty is False
+        assert P.open(1, 1 + 1e-16).shift(1).empty
+
+    def test_same_as_apply(self):
+        rnd = random.Random(42)
+        for _ in range(100):
+            i = P.Interval(*[
+                P.Interval.from_atomic(rnd.choice([P.OPEN, P.CLOSED]), x, x + rnd.randint(0, 3), rnd.choice([P.OPEN, P.CLOSED]))
+                for x in (rnd.randint(0, 50) for _ in range(rnd.randint(1, 10)))
+            ])
+            delta, factor = rnd.randint(-10, 10), rnd.choice([-3, -1, 2, 5])
+            assert i.shift(delta) == i.apply(lambda s: s.replace(lower=lambda x: x + delta, upper=lambda x: x + delta))
+            assert i.scale(factor) == P.Interval(*[
+                P.Interval.from_atomic(s.right, s.upper * factor, s.lower * factor, s.left) if factor < 0
+                else P.Interval.from_atomic(s.left, s.lower * factor, s.upper * factor, s.right)
+                for s in i if not s.empty
+            ])
+
+    def test_with_tolerance(self, tolerance):
+        i = P.closed(0, 1) | P.closed(2, 3)
+        assert i.scale(1e-7) == P.closed(0, 3e-7)
+        assert i.shift(1) == P.closed(1, 2) | P.closed(3, 4)
+
+    def test_quantized(self):
+        with P.tolerance(0, 0.5, quantized=True):
+            assert P.closed(0, 1).shift(0.3) == P.closed(0.5, 1.5)
+
+
 class TestIntervalApply:
     def test_apply(self):
         i = P.closed(0, 1)
@@ -480,6 +811,72 @@ class TestIntervalContainment:
         assert 7 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
         assert 11 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
 
+    def test_with_values_on_large_union(self):
+        i = P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 2000, 2)])
+        assert all(x in i for x in range(0, 2000, 2))
+        assert all(x + 0.5 in i for x in range(0, 2000, 2))
+        assert not any(x + 1 in i for x in range(0, 2000, 2))
+        assert not any(x + 1.5 in i for x in range(0, 2000, 2))
+        assert -1 not in i
+        assert 2000 not in i
+
+    def test_with_values_and_tolerance(self, tolerance):
+        i = P.closed(0, 1) | P.open(2, 3) | P.closed(4, 5)
+        assert -1e-7 in i
+        assert 1 + 1e-7 in i
+        assert 4 - 1e-7 in i
+        assert 2 + 1e-7 not in i
+        assert 3 - 1e-7 not in i
+        assert 2.5 in i
+        assert 3.5 not in i
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_many_values(self, use_numpy, monkeypatch):
+        if use_numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(P.interval, 'numpy', None)
+
+        i = P.openclosed(-P.inf, 0) | P.open(1, 2) | P.closedopen(3, 4) | P.singleton(5)
+        values = [-P.inf, -1, 0, 0.5, 1, 1.5, 2, 3, 3.5, 4, 5, 6, P.inf]
+        assert [bool(b) for b in i.contains_many(values)] == [False] + [v in i for v in values[1:-1]] + [False]
+        assert not any(P.empty().contains_many(values))
+        assert list(P.open(-P.inf, P.inf).contains_many([])) == []
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_many_values_with_tolerance(self, use_numpy, monkeypatch, tolerance):
+        if use_numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(P.interval, 'numpy', None)
+
+        i = P.closed(0, 1) | P.open(2, 3) | P.closed(4, 5)
+        values = [-1e-7, 1 + 1e-7, 2 + 1e-7, 2.5, 3 - 1e-7, 3.5, 4 - 1e-7]
+        assert [bool(b) for b in i.contains_many(values)] == [v in i for v in values]
+        assert [bool(b) for b in i.contains_many(values)] == [True, True, False, True, False, False, True]
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_many_values_with_tolerance_and_close_intervals(self, use_numpy, monkeypatch):
+        if use_numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(P.interval, 'numpy', None)
+
+        # Atomic intervals that are distinct without tolerance, but whose bounds are close
+        i = P.closed(0, 1) | P.open(1 + 1e-9, 2)
+        j = P.open(0, 1 - 1e-9) | P.open(1 - 5e-10, 1 - 2e-10) | P.closed(1, 2)
+        with P.tolerance(0, 1e-6):
+            assert 1 + 2e-9 in i and 1 - 2e-9 in j
+            assert [bool(b) for b in i.contains_many([1 + 2e-9, 2, 3])] == [True, False, False]
+            assert [bool(b) for b in j.contains_many([1 - 2e-9, -1e-7])] == [True, False]
+
+    def test_many_values_with_numpy_array(self):
+        numpy = pytest.importorskip('numpy')
+        i = P.closed(0, 1) | P.closed(2, 3)
+        result = i.contains_many(numpy.array([[0.5, 1.5], [2.5, 3.5]]))
+        assert result.dtype == bool
+        assert result.tolist() == [[True, False], [True, False]]
+
     def test_with_infinities(self):
         assert 1 in P.closed(-P.inf, P.inf)
         assert 1 in P.closed(-P.inf, 1)
@@ -610,6 +1007,27 @@ class TestIntervalUnion:
     def test_with_empty(self):
         assert P.closed(0, 1) | P.empty() == P.closed(0, 1)
 
+    def test_with_unions(self):
+        i1 = P.Interval(*[P.closed(x, x + 1) for x in range(0, 100, 4)])
+        i2 = P.Interval(*[P.open(x, x + 2) for x in range(1, 100, 4)])
+        assert i1 | i2 == P.Interval(i1, i2)
+        assert i2 | i1 == P.Interval(i1, i2)
+        assert i1 | i2 == P.Interval(*[P.closedopen(x, x + 3) for x in range(0, 100, 4)])
+
+    def test_fold(self):
+        i = P.empty()
+        for x in [10, 0, 5, 2, 8, 4, 1]:
+            i = i | P.closedopen(x, x + 1)
+        assert i == P.closedopen(0, 3) | P.closedopen(4, 6) | P.closedopen(8, 9) | P.closedopen(10, 11)
+        assert i | P.closed(3, 4) == P.closedopen(0, 6) | P.closedopen(8, 9) | P.closedopen(10, 11)
+        assert P.closed(6, 10) | i == P.closedopen(0, 3) | P.closedopen(4, 11)
+        assert i | P.open(-P.inf, P.inf) == P.open(-P.inf, P.inf)
+
+    def test_with_same_lower_bounds(self):
+        i = P.Interval(P.closedopen(0, 1), P.openclosed(1, 2), P.closed(1, 3))
+        assert i == P.closed(0, 3)
+        assert i.atomic
+
     def test_issue_12(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/12
         assert P.open(0, 2) | P.closed(0, 2) == P.closed(0, 2)
@@ -669,6 +1087,17 @@ class TestIntervalComplement:
         for interval in i:
             assert ~(~interval) == interval
 
+    def test_infinities(self):
+        assert ~P.openclosed(-P.inf, 0) == P.open(0, P.inf)
+        assert ~P.closedopen(0, P.inf) == P.open(-P.inf, 0)
+        assert ~(P.open(-P.inf, 0) | P.open(1, P.inf)) == P.closed(0, 1)
+
+    def test_large_union(self):
+        i = P.Interval(*[P.closedopen(x, x + 1) for x in range(0, 100, 2)])
+        c = P.open(-P.inf, 0) | P.Interval(*[P.closedopen(x, x + 1) for x in range(1, 99, 2)]) | P.closedopen(99, P.inf)
+        assert ~i == c
+        assert ~c == i
+
     def test_empty(self):
         assert ~P.open(1, 1) == P.open(-P.inf, P.inf)
         assert (~P.closed(-P.inf, P.inf)).empty
@@ -709,6 +1138,35 @@ class TestIntervalDifference:
         assert P.closed(0, 2) - P.closed(-2, 1) == P.openclosed(1, 2)
         assert P.closed(0, 2) - P.open(-2, 1) == P.closed(1, 2)
 
+    def test_with_unions(self):
+        i = P.closed(0, 4) | P.closed(6, 10)
+        assert i - (P.closed(1, 2) | P.open(3, 7)) == P.closedopen(0, 1) | P.openclosed(2, 3) | P.closed(7, 10)
+        assert i - (P.open(-1, 0) | P.open(4, 6) | P.singleton(8)) == i - P.singleton(8)
+        assert i - P.closed(2, 8) == P.closedopen(0, 2) | P.openclosed(8, 10)
+        assert i - (P.closed(-P.inf, 1) | P.closed(9, P.inf)) == P.openclosed(1, 4) | P.closedopen(6, 9)
+
+    def test_with_large_unions(self):
+        i1 = P.Interval(*[P.closedopen(x, x + 7) for x in range(0, 1000, 10)])
+        i2 = P.Interval(*[P.closed(x, x + 3) for x in range(5, 1000, 10)])
+        assert i1 - i2 == P.Interval(*[P.closedopen(x, x + 5) for x in range(0, 1000, 10)])
+        assert i1 - i2 == i1 & ~i2
+
+    def test_same_with_and_without_tolerance(self):
+        rnd = random.Random(42)
+
+        def interval():
+            return P.Interval(*[
+                P.Interval.from_atomic(rnd.choice([P.OPEN, P.CLOSED]), x, x + rnd.randint(0, 3), rnd.choice([P.OPEN, P.CLOSED]))
+                for x in (rnd.randint(-5, 30) for _ in range(rnd.randint(0, 6)))
+            ])
+
+        for _ in range(200):
+            i, j = interval(), interval()
+            with P.tolerance(0, 1e-6):
+                expected = i - j
+            assert i - j == expected
+            assert i - j == i & ~j
+
     def test_proxy_method(self):
         i1, i2 = P.closed(0, 1), P.closed(2, 3)
         assert i1 - i2 == i1.difference(i2)
@@ -718,6 +1176,54 @@ class TestIntervalDifference:
             P.closed(0, 1) - 1
 
 
+class TestIntervalSymmetricDifference:
+    @pytest.mark.parametrize('i', [P.closed(0, 1), P.open(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.empty(), P.singleton(0)])
+    def test_with_itself(self, i):
+        assert i ^ i == P.empty()
+        assert i ^ P.empty() == i
+        assert P.empty() ^ i == i
+
+    def test_with_disjoint(self):
+        assert P.closed(0, 1) ^ P.closed(2, 3) == P.closed(0, 1) | P.closed(2, 3)
+        assert P.closed(0, 1) ^ P.open(1, 2) == P.closedopen(0, 2)
+        assert P.closedopen(0, 1) ^ P.closed(1, 2) == P.closed(0, 2)
+
+    def test_with_overlap(self):
+        assert P.closed(0, 2) ^ P.closed(1, 3) == P.closedopen(0, 1) | P.openclosed(2, 3)
+        assert P.closed(0, 2) ^ P.open(0, 2) == P.singleton(0) | P.singleton(2)
+        assert P.closed(0, 4) ^ P.closed(1, 2) == P.closedopen(0, 1) | P.openclosed(2, 4)
+        assert P.closed(0, 2) ^ P.closed(2, 3) == P.closedopen(0, 2) | P.openclosed(2, 3)
+        assert P.open(-P.inf, P.inf) ^ P.closed(0, 1) == ~P.closed(0, 1)
+
+    def test_with_unions(self):
+        i1 = P.closed(0, 4) | P.closed(6, 10)
+        i2 = P.open(2, 7) | P.singleton(8) | P.closed(10, 12)
+        assert i1 ^ i2 == P.closed(0, 2) | P.open(4, 6) | P.closedopen(7, 8) | P.open(8, 10) | P.openclosed(10, 12)
+
+    def test_with_large_unions(self):
+        i1 = P.Interval(*[P.closedopen(x, x + 7) for x in range(0, 1000, 10)])
+        i2 = P.Interval(*[P.closed(x, x + 3) for x in range(5, 1000, 10)])
+        assert i1 ^ i2 == (i1 - i2) | (i2 - i1)
+        assert i1 ^ i2 == i2 ^ i1
+
+    def test_with_tolerance(self, tolerance):
+        assert P.closed(0, 1) ^ P.closed(1e-9, 1 + 1e-9) == P.empty()
+        assert P.closed(0, 2) ^ P.closed(1, 3 + 1e-9) == P.closedopen(0, 1) | P.openclosed(2, 3)
+
+    def test_with_domains(self):
+        d1 = P.IntervalDict([(P.closed(0, 2), 'a'), (P.closed(4, 5), 'b')])
+        d2 = P.IntervalDict([(P.closed(1, 5), 'a')])
+        assert d1.domain() ^ d2.domain() == P.closedopen(0, 1) | P.open(2, 4)
+
+    def test_proxy_method(self):
+        i1, i2 = P.closed(0, 2), P.closed(1, 3)
+        assert i1 ^ i2 == i1.symmetric_difference(i2)
+
+    def test_with_invalid_type(self):
+        with pytest.raises(TypeError):
+            P.closed(0, 1) ^ 1
+
+
 class TestIntervalIteration:
     def test_length(self):
         i1 = P.closed(10, 10) | P.closed(5, 6) | P.closed(7, 8) | P.closed(8, 9)
@@ -757,3 +1263,186 @@ class TestIntervalIteration:
         assert len(P.empty()) == 1
         assert list(P.empty()) == [P.empty()]
         assert P.empty()[0] == P.empty()
+
+    def test_atomics(self):
+        i = P.closed(10, 10) | P.closedopen(5, 6) | P.closed(7, 8) | P.open(8, 9)
+        view = i.atomics()
+        assert len(view) == 3
+        assert list(view) == [(P.CLOSED, 5, 6, P.OPEN), (P.CLOSED, 7, 9, P.OPEN), (P.CLOSED, 10, 10, P.CLOSED)]
+        assert view[0] == (P.CLOSED, 5, 6, P.OPEN)
+        assert view[-1].lower == 10
+        assert list(reversed(view)) == list(view)[::-1]
+        assert [P.Interval.from_atomic(*a) for a in view] == list(i)
+
+        with pytest.raises(IndexError):
+            view[3]
+
+    def test_atomics_slices(self):
+        i = P.Interval(*[P.closed(x, x + 1) for x in range(0, 20, 2)])
+        view = i.atomics()
+        assert list(view[2:5]) == list(view)[2:5]
+        assert list(view[::-2]) == list(view)[::-2]
+        assert list(view[1:8][::3]) == list(view)[1:8][::3]
+        assert len(view[5:2]) == 0
+        assert view[2:5][1] == (P.CLOSED, 6, 7, P.CLOSED)
+
+    def test_atomics_on_empty(self):
+        assert list(P.empty().atomics()) == [(P.OPEN, P.inf, -P.inf, P.OPEN)]
+
+
+class TestExactComparison:
+    @staticmethod
+    def random_interval(rnd, n):
+        bounds = [P.CLOSED, P.OPEN]
+        atomics = []
+        for _ in range(n):
+            lower = rnd.randint(0, 40) / 2
+            upper = rnd.choice([P.inf, lower, lower + rnd.randint(0, 6) / 2])
+            lower = rnd.choice([-P.inf, lower, lower])
+            atomics.append(P.Interval.from_atomic(rnd.choice(bounds), lower, upper, rnd.choice(bounds)))
+        return atomics
+
+    @pytest.mark.parametrize('seed', range(10))
+    def test_with_generic_operator(self, seed):
+        # A fuzzy operator without tolerance has the same semantics, but uses generic code paths
+        rnd = random.Random(seed)
+        atomics1, atomics2 = self.random_interval(rnd, 20), self.random_interval(rnd, 20)
+        values = [x / 4 for x in range(-4, 90)] + [P.inf, -P.inf]
+
+        i1, i2 = P.Interval(*atomics1), P.Interval(*atomics2)
+        results = [list(i1.atomics()), list(i2.atomics()), list((i1 & i2).atomics()), [v in i1 for v in values]]
+
+        P.set_operator(FuzzyOperator())
+        try:
+            i1, i2 = P.Interval(*atomics1), P.Interval(*atomics2)
+            assert list(i1.atomics()) == results[0]
+            assert list(i2.atomics()) == results[1]
+            assert list((i1 & i2).atomics()) == results[2]
+            assert [v in i1 for v in values] == results[3]
+        finally:
+            P.set_operator(ClassicOperator())
+
+
+class TestTolerance:
+    def test_set_tolerance(self, tolerance):
+        assert P.closed(0, 1) == P.closed(1e-9, 1)
+        assert isinstance(P.get_operator(), FuzzyOperator)
+
+        operator = P.get_operator()
+        P.set_tolerance(0, 1e-3)
+        assert P.get_operator() is not operator
+        assert operator.abs_tol == 1e-6
+
+    @pytest.mark.parametrize('operator', [ClassicOperator(), FuzzyOperator(0, 1e-6)])
+    def test_cmp(self, operator):
+        values = [-P.inf, -1, 0, 1e-9, 0.5, 1, P.inf]
+        for a in values:
+            for b in values:
+                expected = -1 if operator.lt(a, b) else (0 if operator.eq(a, b) else 1)
+                assert operator.cmp(a, b) == expected
+                assert operator.gt(a, b) == (expected == 1)
+        assert FuzzyOperator(0, 1e-6).cmp(0, 1e-9) == 0
+        assert ClassicOperator().cmp(0, 1e-9) == -1
+
+    def test_quantized(self):
+        with P.tolerance(abs_tol=1e-3, quantized=True):
+            assert isinstance(P.get_operator(), QuantizedOperator)
+            i = P.closed(0.0004, 1.0006)
+            assert (i.lower, i.upper) == (0, 1.001)
+            assert P.closed(0, 1) == P.closed(0.0001, 0.9999)
+            assert P.closed(0, 1) != P.closed(0, 1.001)
+            assert P.closed(0, 1) | P.open(1.0004, 2) == P.closedopen(0, 2)
+            assert P.closed(0, 1) & P.closed(1.0004, 2) == P.singleton(1)
+            assert P.closed(0, 0.0004) == P.singleton(0)
+            assert P.open(0, 0.0004).empty
+            assert P.closedopen(-P.inf, 2.0004) == P.open(-P.inf, 2)
+            assert P.openclosed(1, float('inf')).upper == float('inf')
+            # Values are not snapped
+            assert 1.0004 not in P.closed(0, 1)
+
+        with P.tolerance(abs_tol=1, quantized=True):
+            i = P.closed(1.4, 2.6)
+            assert (i.lower, i.upper) == (1, 3)
+            assert isinstance(i.lower, int)
+
+    def test_quantized_default(self):
+        P.set_tolerance(0, 0.5, quantized=True)
+        try:
+            assert P.closed(0.1, 0.9) == P.closed(0, 1)
+            assert isinstance(P.get_operator(), ClassicOperator)
+        finally:
+            P.set_operator(ClassicOperator())
+
+    def test_quantized_does_not_snap_existing_intervals(self):
+        i = P.closed(0.1, 0.9) | P.closed(2.1, 2.9)
+        with P.tolerance(0, 0.5, quantized=True):
+            assert (i.enclosure.lower, i.enclosure.upper) == (0.1, 2.9)
+            assert [(s.lower, s.upper) for s in i] == [(0.1, 0.9), (2.1, 2.9)]
+            assert i[-1].upper == 2.9
+            # Only provided bounds are snapped
+            assert i.replace(upper=4.8)[-1].atomics()[0] == (P.CLOSED, 2.1, 5, P.CLOSED)
+        assert i.enclosure == P.closed(0.1, 2.9)
+        assert i.replace(upper=5) == P.closed(0.1, 0.9) | P.closed(2.1, 5)
+
+    def test_quantized_with_invalid_tolerance(self):
+        with pytest.raises(ValueError):
+            QuantizedOperator(0)
+        with pytest.raises(ValueError):
+            P.set_tolerance(1e-3, 1e-3, quantized=True)
+
+    def test_context_manager(self):
+        assert P.closed(0, 1) != P.closed(1e-9, 1)
+        with P.tolerance(0, 1e-6):
+            assert P.closed(0, 1) == P.closed(1e-9, 1)
+            with P.tolerance(abs_tol=1e-12):
+                assert P.closed(0, 1) != P.closed(1e-9, 1)
+            assert P.closed(0, 1) == P.closed(1e-9, 1)
+        assert P.closed(0, 1) != P.closed(1e-9, 1)
+        assert isinstance(P.get_operator(), ClassicOperator)
+
+    def test_context_manager_with_exception(self):
+        with pytest.raises(ValueError):
+            with P.tolerance(0, 1e-6):
+                raise ValueError()
+        assert isinstance(P.get_operator(), ClassicOperator)
+
+    def test_context_manager_overrides_default(self, tolerance):
+        with P.tolerance(0, 0):
+            assert P.closed(0, 1) != P.closed(1e-9, 1)
+        assert P.closed(0, 1) == P.closed(1e-9, 1)
+
+    def test_context_manager_is_local_to_threads(self):
+        started, done = threading.Event(), threading.Event()
+        results = []
+
+        def other_thread():
+            with P.tolerance(0, 1e-6):
+                started.set()
+                done.wait(5)
+                results.append(P.closed(0, 1) == P.closed(1e-9, 1))
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        started.wait(5)
+        results.append(P.closed(0, 1) == P.closed(1e-9, 1))
+        done.set()
+        thread.join()
+
+        assert results == [False, True]
+
+    def test_thread_local_fallback(self):
+        var = P.interval._ThreadLocalVar('operator')
+        assert var.get(1) == 1
+        token = var.set(2)
+        assert var.get(1) == 2
+        inner = var.set(3)
+        assert var.get(1) == 3
+        var.reset(inner)
+        assert var.get(1) == 2
+        var.reset(token)
+        assert var.get(1) == 1
+
+        thread = threading.Thread(target=lambda: var.set(4))
+        thread.start()
+        thread.join()
+        assert var.get(1) == 1